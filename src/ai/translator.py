@@ -3,15 +3,26 @@ AI Translation Module
 Schema pruning and DSL generation using OpenAI/Anthropic
 """
 
+import hashlib
 import json
 import os
 from typing import Dict, List, Optional
 
 from pydantic import BaseModel, Field, ValidationError
 
-from src.models.dsl import EnterpriseControlDSL
+from src.models.dsl import DSL_ADAPTER, EnterpriseControlDSL
 from src.utils.logging_config import get_logger
 
+# When max_retries is exhausted, instructor raises its own retry exception
+# (a plain Exception subclass, NOT a pydantic ValidationError), so the
+# cascade must catch it explicitly. Guarded import: instructor is only a
+# hard requirement once AITranslator is constructed.
+try:
+    from instructor.core import InstructorRetryException
+except ImportError:  # pragma: no cover - instructor not installed
+    class InstructorRetryException(Exception):
+        """Placeholder so except clauses stay valid without instructor"""
+
 # Get logger for this module
 logger = get_logger(__name__)
 
@@ -178,9 +189,22 @@ class AITranslator:
     Fully leverages Instructor for self-correction loops and guaranteed JSON.
     """
 
-    def __init__(self, api_key: Optional[str] = None, model: str = "deepseek-chat"):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        model: str = "deepseek-chat",
+        cheap_model: Optional[str] = None,
+    ):
         self.model = model
-        logger.info(f"Initializing AITranslator with model: {model}")
+        # Optional cascade: try a cheaper model first and only escalate to the
+        # primary model when Pydantic validation fails. Simple controls are
+        # handled by the cheap model most of the time, cutting token spend.
+        self.cheap_model = cheap_model
+        self.stats = {"cascade_hits": 0, "cascade_misses": 0}
+        logger.info(
+            f"Initializing AITranslator with model: {model}"
+            + (f" (cascade via {cheap_model})" if cheap_model else "")
+        )
 
         try:
             import instructor
@@ -266,6 +290,49 @@ class AITranslator:
             )
             raise
 
+    def translate_controls(
+        self, requests: List[tuple]
+    ) -> List[EnterpriseControlDSL]:
+        """
+        Batch translation with content-hash deduplication.
+
+        Control libraries often contain near-duplicate boilerplate controls
+        (same text, different control_id). Each unique
+        (control_text, evidence_headers) pair is translated exactly once and
+        the resulting DSL is fanned back out to every requesting index.
+
+        Args:
+            requests: List of (control_text, evidence_headers) tuples
+
+        Returns:
+            List of validated EnterpriseControlDSL, one per request, in order
+        """
+        logger.info(f"Starting batch translation of {len(requests)} control(s)")
+
+        # Group request indices by content hash
+        groups: Dict[str, List[int]] = {}
+        for idx, (control_text, evidence_headers) in enumerate(requests):
+            key_material = control_text + json.dumps(evidence_headers, sort_keys=True)
+            key = hashlib.sha256(key_material.encode()).hexdigest()
+            groups.setdefault(key, []).append(idx)
+
+        logger.info(
+            f"Deduplicated to {len(groups)} unique control(s) "
+            f"({len(requests) - len(groups)} duplicate(s) skipped)"
+        )
+
+        # Translate each unique control once, then scatter to all duplicates.
+        # DSL objects are validated Pydantic models treated as immutable after
+        # approval, so sharing one instance across duplicate slots is safe.
+        results: List[Optional[EnterpriseControlDSL]] = [None] * len(requests)
+        for indices in groups.values():
+            control_text, evidence_headers = requests[indices[0]]
+            dsl = self.translate_control(control_text, evidence_headers)
+            for idx in indices:
+                results[idx] = dsl
+
+        return results  # type: ignore[return-value]
+
     def _prune_schema(
         self, control_text: str, evidence_headers: Dict[str, List[str]]
     ) -> PrunedSchema:
@@ -281,6 +348,10 @@ class AITranslator:
             control_text=control_text, all_column_names=", ".join(all_columns)
         )
 
+        # Budget the response by input size: the model only needs to echo a
+        # handful of column names plus a short rationale.
+        max_tokens = min(500, 80 + 15 * len(all_columns))
+
         try:
             # Use Instructor to guarantee the output matches PrunedSchema
             result = self.client.chat.completions.create(
@@ -290,7 +361,7 @@ class AITranslator:
                     {"role": "system", "content": "You are a banking data architect."},
                     {"role": "user", "content": prompt},
                 ],
-                max_tokens=500,
+                max_tokens=max_tokens,
                 temperature=0.1,
                 max_retries=2,  # Automatic self-correction if it hallucinates format
             )
@@ -322,25 +393,21 @@ class AITranslator:
             dataset_aliases=list(evidence_headers.keys()),
         )
 
+        # Size the response ceiling to the pruned schema instead of a flat
+        # 4000 tokens: small controls produce small DSLs, and providers that
+        # pre-allocate KV cache by max_tokens schedule tighter requests faster.
+        max_tokens = min(
+            4000,
+            600
+            + 150 * sum(len(cols) for cols in pruned_columns.values())
+            + 80 * len(evidence_headers),
+        )
+
         try:
             # Let Instructor handle the heavy lifting.
             # If the LLM generates an invalid operator, Instructor will catch it,
             # append the error to the prompt, and try again up to 3 times.
-            logger.debug(f"Calling LLM for DSL generation (model: {self.model})")
-            result = self.client.chat.completions.create(
-                model=self.model,
-                response_model=EnterpriseControlDSL,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are a compliance control compiler.",
-                    },
-                    {"role": "user", "content": prompt},
-                ],
-                max_tokens=4000,
-                temperature=0.1,
-                max_retries=3,  # <--- FIX: This replaces your manual try/except loop!
-            )
+            result = self._generate_dsl_cascade(prompt, max_tokens)
             logger.debug("DSL generation successful")
             logger.debug(
                 f"Generated DSL: control_id={result.governance.control_id}, "
@@ -375,6 +442,62 @@ class AITranslator:
             )
             raise
 
+    def _generate_dsl_cascade(
+        self, prompt: str, max_tokens: int = 4000
+    ) -> EnterpriseControlDSL:
+        """
+        Runs the DSL generation call through the model cascade.
+
+        If a cheap model is configured, it gets one shot (max_retries=1);
+        when it cannot produce a valid DSL (instructor surfaces exhausted
+        retries as InstructorRetryException, direct validation failures as
+        ValidationError) we escalate to the primary model with the full
+        self-correction budget (max_retries=3). Without a cheap model this
+        degrades to a single primary-model call.
+        """
+        candidates = (
+            [(self.cheap_model, 1), (self.model, 3)]
+            if self.cheap_model
+            else [(self.model, 3)]
+        )
+
+        last_error: Optional[Exception] = None
+        for model_name, retries in candidates:
+            logger.debug(f"Calling LLM for DSL generation (model: {model_name})")
+            try:
+                result = self.client.chat.completions.create(
+                    model=model_name,
+                    response_model=EnterpriseControlDSL,
+                    messages=[
+                        {
+                            "role": "system",
+                            "content": "You are a compliance control compiler.",
+                        },
+                        {"role": "user", "content": prompt},
+                    ],
+                    max_tokens=max_tokens,
+                    temperature=0.1,
+                    max_retries=retries,
+                )
+                if self.cheap_model:
+                    if model_name == self.cheap_model:
+                        self.stats["cascade_hits"] += 1
+                        logger.info(f"Cascade hit: {model_name} produced valid DSL")
+                return result
+            except (ValidationError, InstructorRetryException) as e:
+                last_error = e
+                if model_name != self.model:
+                    self.stats["cascade_misses"] += 1
+                    logger.info(
+                        f"Cheap model {model_name} failed validation, "
+                        f"escalating to {self.model}"
+                    )
+                    continue
+                raise
+
+        # Unreachable unless the candidate list is empty, but keeps mypy happy
+        raise last_error or RuntimeError("No model candidates configured")
+
     def heal_dsl(
         self,
         original_dsl: EnterpriseControlDSL,
@@ -518,7 +641,7 @@ class MockAITranslator:
             },
         }
 
-        return EnterpriseControlDSL(**mock_dsl_dict)
+        return DSL_ADAPTER.validate_python(mock_dsl_dict)
 
     def heal_dsl(
         self,
@@ -534,3 +657,11 @@ class MockAITranslator:
         # In mock mode, we can't actually fix anything, so just return original
         # In real tests, use a real AITranslator
         return original_dsl
+
+
+# Pydantic v2 builds a model's core validator lazily on first use, which puts
+# a one-off ~10-50ms hit on the first translation call. Force the build at
+# import time instead so the latency-sensitive first call pays nothing.
+# EnterpriseControlDSL covers the nested assertion/pipeline unions too.
+PrunedSchema.model_rebuild()
+EnterpriseControlDSL.model_rebuild()
@@ -4,8 +4,11 @@ LLM-powered validation of DSL and SQL before execution.
 Acts as a "second pair of eyes" to catch semantic errors.
 """
 
+import hashlib
 import json
 import os
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel, Field
@@ -15,146 +18,158 @@ from src.utils.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Instructor-wrapped OpenAI clients shared across validator instances,
+# keyed by (api_key, base_url, timeout)
+_CLIENT_CACHE: Dict[tuple, Any] = {}
 
-class ValidationIssue(BaseModel):
+
+def _strip_schema_titles(schema: Any) -> None:
+    """Recursively removes auto-generated 'title' keys from a JSON schema"""
+    if isinstance(schema, dict):
+        schema.pop("title", None)
+        for value in schema.values():
+            _strip_schema_titles(value)
+    elif isinstance(schema, list):
+        for item in schema:
+            _strip_schema_titles(item)
+
+
+class CompactSchemaModel(BaseModel):
+    """
+    Base model whose JSON schema omits auto-generated titles.
+
+    Instructor injects each response model's JSON schema into every request;
+    the titles Pydantic adds per model/field are pure token overhead for the
+    LLM, so strip them before they hit the wire.
+    """
+
+    @classmethod
+    def model_json_schema(cls, *args, **kwargs) -> Dict[str, Any]:
+        schema = super().model_json_schema(*args, **kwargs)
+        _strip_schema_titles(schema)
+        return schema
+
+
+class ValidationIssue(CompactSchemaModel):
     """Represents a validation issue found by the LLM reviewer"""
 
-    severity: str = Field(description="Severity level: CRITICAL, WARNING, INFO")
+    severity: str = Field(description="CRITICAL|WARNING|INFO")
     category: str = Field(
-        description="Category: DSL_STRUCTURE, SCHEMA_MISMATCH, SQL_LOGIC, SEMANTICS"
-    )
-    message: str = Field(description="Human-readable description of the issue")
-    suggested_fix: Optional[str] = Field(
-        default=None, description="If available, suggested fix for the issue"
+        description="DSL_STRUCTURE|SCHEMA_MISMATCH|SQL_LOGIC|SEMANTICS"
     )
+    message: str = Field(description="Issue description")
+    suggested_fix: Optional[str] = Field(default=None, description="Optional fix")
 
 
-class ValidationReport(BaseModel):
+class ValidationReport(CompactSchemaModel):
     """Structured validation report from LLM reviewer"""
 
-    is_valid: bool = Field(description="True if no CRITICAL issues found")
+    is_valid: bool = Field(description="True if no CRITICAL issues")
     issues: List[ValidationIssue] = Field(
-        default_factory=list, description="List of issues found during validation"
-    )
-    overall_assessment: str = Field(
-        description="High-level summary of validation results"
-    )
-    confidence_score: float = Field(
-        ge=0.0, le=1.0, description="Confidence in the validation (0.0-1.0)"
+        default_factory=list, description="Issues found"
     )
+    overall_assessment: str = Field(description="Brief summary")
+    confidence_score: float = Field(ge=0.0, le=1.0, description="Confidence 0-1")
 
 
-DSL_VALIDATION_PROMPT = """You are a Principal Banking Compliance Auditor and Data Architect reviewing a generated control DSL.
+class CombinedValidationReport(CompactSchemaModel):
+    """DSL and SQL validation reports produced by a single LLM call"""
 
-CONTEXT:
-Your role is to validate that the generated DSL correctly implements the control requirements, 
-uses proper schema bindings, and will execute correctly against the available data.
+    dsl_validation: ValidationReport = Field(description="DSL review")
+    sql_validation: ValidationReport = Field(description="SQL review")
 
-INPUTS:
-1. CONTROL REQUIREMENTS (original business requirement):
-{control_text}
 
-2. GENERATED DSL (JSON):
-{dsl_json}
+# Prompts are deliberately terse: validation is input-token-dominated, and the
+# response schema is already enforced by instructor's response_model, so no
+# OUTPUT JSON block or severity glossary needs to ride along on every call.
 
-3. AVAILABLE SCHEMAS (actual Parquet columns):
-{schema_info}
+# Template ordering matters for provider-side prefix caching: the static
+# instruction block comes first, then slow-changing context (schemas), then
+# per-call payloads (control text, DSL, SQL) last, so repeated calls share
+# the longest possible cached prefix.
 
-VALIDATION CHECKLIST:
-□ Does the DSL accurately implement the control requirements?
-□ Are all ontology_bindings mapped to actual columns in the schemas?
-□ Are population filters correctly scoped (not filtering out records that should fail)?
-□ Are assertions checking the RIGHT conditions (not inverted logic)?
-□ For LEFT JOINs, are NULL checks correctly placed?
-  - If "absence of join = compliance", filter WHERE right_key IS NOT NULL in population
-  - If "absence of join = failure", assert right_key IS NOT NULL in assertions
-□ Are column names qualified correctly for joined datasets?
-□ For composite joins, are left_keys and right_keys both LISTS?
-□ Are operators valid for the assertion type?
-□ Are materiality thresholds reasonable?
-□ Is the evidence metadata complete?
-
-COMMON ERRORS TO CATCH:
-1. **Filter vs Assertion Trap**: Missing records filtered in population instead of caught as failures in assertions
-2. **NULL Semantics**: Not handling LEFT JOIN NULLs correctly
-3. **Schema Drift**: Referencing columns that don't exist in the Parquet files
-4. **Inverted Logic**: Checking "status = APPROVED" when control says "must NOT be approved"
-5. **Unqualified Joins**: Using "tax_id" instead of "ofac_list.tax_id" after a join
-6. **Semantic Mismatch**: DSL implements something different than the control requirement
-
-OUTPUT (JSON):
-{{
-  "is_valid": true/false,
-  "issues": [
-    {{
-      "severity": "CRITICAL|WARNING|INFO",
-      "category": "DSL_STRUCTURE|SCHEMA_MISMATCH|SQL_LOGIC|SEMANTICS",
-      "message": "Clear description of the issue",
-      "suggested_fix": "How to fix it (optional)"
-    }}
-  ],
-  "overall_assessment": "Brief summary",
-  "confidence_score": 0.0-1.0
-}}
+DSL_VALIDATION_PROMPT = """You are a Principal Banking Compliance Auditor and Data Architect reviewing a generated control DSL.
 
-SEVERITY LEVELS:
-- CRITICAL: Will cause execution failure or produce wrong results
-- WARNING: Suboptimal but may work
-- INFO: Best practice suggestion
+CHECK:
+- DSL implements the control requirements (no semantic mismatch, no inverted logic)
+- ontology_bindings reference real columns (no schema drift)
+- Population filters only scope the dataset; records that should FAIL must be caught by assertions, never filtered out (filter-vs-assertion trap)
+- LEFT JOIN NULL semantics: absence=compliance -> population filter right_key IS NOT NULL; absence=failure -> assertion right_key IS NOT NULL
+- Joined columns qualified; composite join left_keys/right_keys are LISTS
+- Operators valid per assertion type; materiality thresholds reasonable; evidence metadata complete
 
+Severity: CRITICAL=wrong results or crash, WARNING=suboptimal, INFO=style.
 Be thorough but practical. Focus on correctness, not style.
+
+AVAILABLE SCHEMAS (actual Parquet columns):
+{schema_info}
+
+CONTROL REQUIREMENTS:
+{control_text}
+
+GENERATED DSL (JSON):
+{dsl_json}
 """
 
 
 SQL_VALIDATION_PROMPT = """You are a DuckDB SQL Expert reviewing compiled SQL for correctness.
 
-CONTEXT:
-A DSL was compiled into DuckDB SQL. Your job is to validate:
-1. SQL syntax correctness
-2. Logical correctness (does it match the control intent?)
-3. Performance/anti-patterns
+CHECK:
+- Syntax valid; referenced columns exist in FROM/JOIN; CTEs properly chained
+- NULL handling in WHERE/HAVING (use IS NOT TRUE, not NOT(NULL)); no ambiguous columns
+- Strings escaped; date/number comparisons CAST correctly
+- Population filters (AND) separated from assertion exceptions (OR)
+- Aggregations in HAVING, not WHERE
+- Final SELECT returns EXCEPTIONS (failing rows), not compliant rows
+
+Severity: CRITICAL=wrong results or crash, WARNING=suboptimal, INFO=style.
+Be strict. SQL errors at runtime are expensive.
+
+AVAILABLE SCHEMAS:
+{schema_info}
 
-INPUTS:
-1. CONTROL REQUIREMENTS:
+CONTROL REQUIREMENTS:
 {control_text}
 
-2. GENERATED DSL:
+GENERATED DSL:
 {dsl_summary}
 
-3. COMPILED SQL:
+COMPILED SQL:
 {sql_query}
+"""
 
-4. AVAILABLE SCHEMAS:
+
+COMBINED_VALIDATION_PROMPT = """You are a Principal Banking Compliance Auditor, Data Architect, and DuckDB SQL Expert reviewing a generated control DSL and its compiled SQL in one pass.
+
+TASK:
+Produce TWO validation reports:
+- "dsl_validation": Does the DSL accurately implement the control requirements?
+  Check ontology bindings against actual columns, population-filter scoping
+  (Filter vs Assertion trap), LEFT JOIN NULL semantics, qualified column names,
+  composite join key lists, operator validity, materiality thresholds.
+- "sql_validation": Is the SQL syntactically and logically correct?
+  Check CTE chaining, column references, NULL handling in WHERE/HAVING, string
+  escaping, date casts, aggregations in HAVING not WHERE, and that the final
+  SELECT returns EXCEPTIONS (failing rows), not compliant rows.
+
+SEVERITY LEVELS:
+- CRITICAL: Will cause execution failure or produce wrong results
+- WARNING: Suboptimal but may work
+- INFO: Best practice suggestion
+
+Be thorough but practical. Focus on correctness, not style.
+
+AVAILABLE SCHEMAS (actual Parquet columns):
 {schema_info}
 
-VALIDATION CHECKLIST:
-□ Is the SQL syntactically valid?
-□ Are all referenced columns present in the FROM/JOIN clauses?
-□ Are CTEs properly chained (each CTE references previous one)?
-□ Are NULL semantics handled correctly in WHERE/HAVING?
-□ Are string values properly escaped?
-□ Are date comparisons using correct syntax?
-□ Does the WHERE clause correctly separate population filters from assertion exceptions?
-□ Are aggregations (SUM, COUNT, AVG) in HAVING clause, not WHERE?
-□ Does the final SELECT return EXCEPTIONS (failing rows), not compliant rows?
-
-COMMON SQL ERRORS:
-1. Referencing column from wrong CTE (e.g., using base.col_name after a join)
-2. Ambiguous column names in joins
-3. Missing CAST for date/number comparisons
-4. NOT (NULL) = NULL instead of IS NOT TRUE
-5. Using AND when OR is needed (or vice versa)
-6. Returning compliant rows instead of exceptions
-
-OUTPUT (JSON):
-{{
-  "is_valid": true/false,
-  "issues": [/* same format as DSL validation */],
-  "overall_assessment": "Brief summary",
-  "confidence_score": 0.0-1.0
-}}
+CONTROL REQUIREMENTS (original business requirement):
+{control_text}
 
-Be strict. SQL errors at runtime are expensive.
+GENERATED DSL (JSON):
+{dsl_json}
+
+COMPILED SQL:
+{sql_query}
 """
 
 
@@ -164,8 +179,36 @@ class AIValidator:
     Uses structured output to ensure deterministic validation reporting.
     """
 
-    def __init__(self, api_key: Optional[str] = None, model: str = "deepseek-chat"):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        model: str = "deepseek-chat",
+        combine_validation: bool = True,
+        cache_enabled: bool = True,
+        timeout: float = 30.0,
+        max_retries: int = 1,
+        skip_sql_on_dsl_critical: bool = True,
+    ):
         self.model = model
+        # Validation retries compound with any SDK-internal retries, so keep
+        # the instructor budget low by default and bound each request with a
+        # wall-clock timeout - a hung call should fail fast, not tie up a
+        # worker for minutes.
+        self.timeout = timeout
+        self.max_retries = max_retries
+        # When True, validate_full_pipeline reviews DSL and SQL in a single
+        # LLM call (one round-trip, shared context tokens). When False, it
+        # issues the two validations as separate concurrent calls.
+        self.combine_validation = combine_validation
+        # Validation is a pure function of (dsl, sql, schemas); cache reports
+        # by content hash so re-validating an unchanged combo (common during
+        # iterative development) costs zero tokens and zero network.
+        self.cache_enabled = cache_enabled
+        # A DSL with CRITICAL issues is getting regenerated anyway, so the
+        # SQL review of its compiled output is a wasted LLM call - skip it.
+        self.skip_sql_on_dsl_critical = skip_sql_on_dsl_critical
+        self._report_cache: "OrderedDict[str, Any]" = OrderedDict()
+        self._report_cache_maxsize = 256
         logger.info(f"Initializing AIValidator with model: {model}")
 
         try:
@@ -185,8 +228,21 @@ class AIValidator:
                 "DeepSeek API key required. Set DEEPSEEK_API_KEY environment variable"
             )
 
-        base_client = OpenAI(api_key=api_key, base_url="https://api.deepseek.com")
-        self.client = instructor.from_openai(base_client)
+        # Reuse one wrapped client per (api_key, base_url, timeout): client
+        # construction and TLS warmup are not free, and workflows that build
+        # a validator per control (tests, CLI) would otherwise pay it every
+        # time. Sharing also reuses the underlying connection pool.
+        base_url = "https://api.deepseek.com"
+        cache_key = (api_key, base_url, timeout)
+        client = _CLIENT_CACHE.get(cache_key)
+        if client is None:
+            client = instructor.from_openai(
+                OpenAI(api_key=api_key, base_url=base_url, timeout=timeout)
+            )
+            _CLIENT_CACHE[cache_key] = client
+        else:
+            logger.debug("Reusing cached instructor client")
+        self.client = client
         logger.info("AIValidator initialized successfully")
 
     def validate_dsl(
@@ -194,6 +250,7 @@ class AIValidator:
         control_text: str,
         dsl: EnterpriseControlDSL,
         manifests: Dict[str, Dict[str, Any]],
+        dsl_json: Optional[str] = None,
     ) -> ValidationReport:
         """
         Validates the generated DSL against control requirements and schemas.
@@ -202,17 +259,25 @@ class AIValidator:
             control_text: Original control requirement text
             dsl: Generated DSL object
             manifests: Parquet manifests with schema information
+            dsl_json: Pre-serialized DSL JSON (avoids a repeat model walk)
 
         Returns:
             ValidationReport with issues and recommendations
         """
         logger.info(f"Validating DSL for control {dsl.governance.control_id}")
 
-        # Prepare schema information
-        schema_info = self._format_schema_info(manifests)
+        # model_json is serialized once per (frozen) DSL instance and
+        # cached, so repeat validations of the same control pay nothing.
+        if dsl_json is None:
+            dsl_json = dsl.model_json.decode()
 
-        # Convert DSL to JSON for LLM review
-        dsl_json = json.dumps(dsl.model_dump(), indent=2)
+        cache_key = self._cache_key("dsl", control_text, dsl_json, "", manifests)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+
+        # Prepare schema information
+        schema_info = self._format_schema_info(manifests, dsl, dsl_json)
 
         prompt = DSL_VALIDATION_PROMPT.format(
             control_text=control_text, dsl_json=dsl_json, schema_info=schema_info
@@ -223,7 +288,7 @@ class AIValidator:
             report = self.client.chat.completions.create(
                 model=self.model,
                 response_model=ValidationReport,
-                max_retries=3,
+                max_retries=self.max_retries,
                 messages=[
                     {
                         "role": "system",
@@ -247,6 +312,7 @@ class AIValidator:
                 elif issue.severity == "WARNING":
                     logger.warning(f"DSL Warning: {issue.message}")
 
+            self._cache_put(cache_key, report)
             return report
 
         except Exception as e:
@@ -274,6 +340,8 @@ class AIValidator:
         dsl: EnterpriseControlDSL,
         sql: str,
         manifests: Dict[str, Dict[str, Any]],
+        dsl_json: Optional[str] = None,
+        dsl_summary: Optional[str] = None,
     ) -> ValidationReport:
         """
         Validates the compiled SQL against DSL and control requirements.
@@ -283,17 +351,28 @@ class AIValidator:
             dsl: DSL object that was compiled
             sql: Compiled SQL query
             manifests: Parquet manifests with schema information
+            dsl_json: Pre-serialized DSL JSON (avoids a repeat model walk)
+            dsl_summary: Pre-built DSL summary (avoids a repeat model walk)
 
         Returns:
             ValidationReport with SQL-specific issues
         """
         logger.info(f"Validating SQL for control {dsl.governance.control_id}")
 
+        if dsl_json is None:
+            dsl_json = dsl.model_json.decode()
+
+        cache_key = self._cache_key("sql", control_text, dsl_json, sql, manifests)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+
         # Prepare schema information
-        schema_info = self._format_schema_info(manifests)
+        schema_info = self._format_schema_info(manifests, dsl, dsl_json)
 
         # Create DSL summary for context
-        dsl_summary = self._create_dsl_summary(dsl)
+        if dsl_summary is None:
+            dsl_summary = self._create_dsl_summary(dsl)
 
         prompt = SQL_VALIDATION_PROMPT.format(
             control_text=control_text,
@@ -307,7 +386,7 @@ class AIValidator:
             report = self.client.chat.completions.create(
                 model=self.model,
                 response_model=ValidationReport,
-                max_retries=3,
+                max_retries=self.max_retries,
                 messages=[
                     {
                         "role": "system",
@@ -331,6 +410,7 @@ class AIValidator:
                 elif issue.severity == "WARNING":
                     logger.warning(f"SQL Warning: {issue.message}")
 
+            self._cache_put(cache_key, report)
             return report
 
         except Exception as e:
@@ -372,8 +452,57 @@ class AIValidator:
         """
         logger.info(f"Running full pipeline validation for {dsl.governance.control_id}")
 
-        dsl_report = self.validate_dsl(control_text, dsl, manifests)
-        sql_report = self.validate_sql(control_text, dsl, sql, manifests)
+        # Serialize the DSL once for the whole pipeline; both validations
+        # (and the schema pruning inside them) reuse the same strings.
+        dsl_json = dsl.model_json.decode()
+        dsl_summary = self._create_dsl_summary(dsl)
+
+        if self.combine_validation:
+            # Single LLM call covering both reviews: control_text and
+            # schema_info are sent once instead of twice, and we pay one
+            # round-trip instead of two.
+            dsl_report, sql_report = self._validate_combined(
+                control_text, dsl, sql, manifests, dsl_json
+            )
+        else:
+            # Both validations are independent network-bound LLM calls, so
+            # issue them in parallel: wall-clock latency drops from the sum
+            # of the two round-trips to the slower of the two.
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                dsl_future = executor.submit(
+                    self.validate_dsl, control_text, dsl, manifests, dsl_json
+                )
+                sql_future = executor.submit(
+                    self.validate_sql,
+                    control_text,
+                    dsl,
+                    sql,
+                    manifests,
+                    dsl_json,
+                    dsl_summary,
+                )
+                dsl_report = dsl_future.result()
+
+                if self.skip_sql_on_dsl_critical and any(
+                    issue.severity == "CRITICAL" for issue in dsl_report.issues
+                ):
+                    # The DSL is already known-broken; cancel the SQL review
+                    # if it hasn't started (zero tokens), otherwise collect
+                    # the in-flight result rather than discard it.
+                    if sql_future.cancel():
+                        logger.info(
+                            "Skipping SQL validation: DSL has CRITICAL issues"
+                        )
+                        sql_report = ValidationReport(
+                            is_valid=False,
+                            issues=[],
+                            overall_assessment="Skipped: DSL has CRITICAL issues",
+                            confidence_score=0.0,
+                        )
+                    else:
+                        sql_report = sql_future.result()
+                else:
+                    sql_report = sql_future.result()
 
         # Summary logging
         overall_valid = dsl_report.is_valid and sql_report.is_valid
@@ -396,17 +525,232 @@ class AIValidator:
             "total_critical_issues": total_critical,
         }
 
-    def _format_schema_info(self, manifests: Dict[str, Dict[str, Any]]) -> str:
-        """Formats manifest schema info for LLM consumption"""
+    def validate_many(
+        self,
+        items: List[tuple],
+        max_concurrency: int = 8,
+        progress_callback: Optional[Any] = None,
+    ) -> List[Dict[str, ValidationReport]]:
+        """
+        Validates a batch of controls concurrently.
+
+        Serially looping validate_full_pipeline over N controls pays N
+        round-trips back to back; fanning them out over a bounded thread
+        pool overlaps the network waits.
+
+        Args:
+            items: List of (control_text, dsl, sql, manifests) tuples
+            max_concurrency: Maximum in-flight LLM validations
+            progress_callback: Optional callable(index, result) invoked as
+                each item completes, in submission order
+
+        Returns:
+            List of validate_full_pipeline results, one per item, in order
+        """
+        logger.info(
+            f"Batch validating {len(items)} control(s) "
+            f"(max_concurrency={max_concurrency})"
+        )
+
+        with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+            futures = [
+                executor.submit(self.validate_full_pipeline, *item) for item in items
+            ]
+            results = []
+            for idx, future in enumerate(futures):
+                result = future.result()
+                if progress_callback is not None:
+                    progress_callback(idx, result)
+                results.append(result)
+
+        return results
+
+    def _cache_key(
+        self,
+        kind: str,
+        control_text: str,
+        dsl_json: str,
+        sql: str,
+        manifests: Dict[str, Dict[str, Any]],
+    ) -> str:
+        """Content hash identifying one validation request"""
+        hasher = hashlib.blake2b()
+        hasher.update(kind.encode())
+        hasher.update(control_text.encode())
+        hasher.update(dsl_json.encode())
+        hasher.update(sql.encode())
+        hasher.update(json.dumps(manifests, sort_keys=True, default=str).encode())
+        return hasher.hexdigest()
+
+    def _cache_get(self, key: str) -> Optional[Any]:
+        """Returns a cached report (LRU touch) or None"""
+        if not self.cache_enabled:
+            return None
+        cached = self._report_cache.get(key)
+        if cached is not None:
+            self._report_cache.move_to_end(key)
+            logger.info(f"Validation cache hit ({key[:12]}...), skipping LLM call")
+        return cached
+
+    def _cache_put(self, key: str, report: Any) -> None:
+        """Stores a report, evicting the least recently used entry if full"""
+        if not self.cache_enabled:
+            return
+        self._report_cache[key] = report
+        self._report_cache.move_to_end(key)
+        if len(self._report_cache) > self._report_cache_maxsize:
+            self._report_cache.popitem(last=False)
+
+    def _validate_combined(
+        self,
+        control_text: str,
+        dsl: EnterpriseControlDSL,
+        sql: str,
+        manifests: Dict[str, Dict[str, Any]],
+        dsl_json: Optional[str] = None,
+    ) -> tuple:
+        """
+        Validates DSL and SQL with a single LLM call.
+
+        Returns:
+            Tuple of (dsl_report, sql_report)
+        """
+        if dsl_json is None:
+            dsl_json = dsl.model_json.decode()
+
+        cache_key = self._cache_key("combined", control_text, dsl_json, sql, manifests)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+
+        schema_info = self._format_schema_info(manifests, dsl, dsl_json)
+
+        prompt = COMBINED_VALIDATION_PROMPT.format(
+            control_text=control_text,
+            dsl_json=dsl_json,
+            sql_query=sql,
+            schema_info=schema_info,
+        )
+
+        try:
+            logger.debug("Calling LLM for combined DSL+SQL validation")
+            combined = self.client.chat.completions.create(
+                model=self.model,
+                response_model=CombinedValidationReport,
+                max_retries=self.max_retries,
+                messages=[
+                    {
+                        "role": "system",
+                        "content": "You are an expert banking compliance auditor and DuckDB SQL engineer.",
+                    },
+                    {"role": "user", "content": prompt},
+                ],
+            )
+
+            for name, report in (
+                ("DSL", combined.dsl_validation),
+                ("SQL", combined.sql_validation),
+            ):
+                logger.info(
+                    f"{name} validation complete: "
+                    f"is_valid={report.is_valid}, "
+                    f"issues={len(report.issues)}, "
+                    f"confidence={report.confidence_score:.2f}"
+                )
+                for issue in report.issues:
+                    if issue.severity == "CRITICAL":
+                        logger.error(f"CRITICAL {name} Issue: {issue.message}")
+                    elif issue.severity == "WARNING":
+                        logger.warning(f"{name} Warning: {issue.message}")
+
+            self._cache_put(
+                cache_key, (combined.dsl_validation, combined.sql_validation)
+            )
+            return combined.dsl_validation, combined.sql_validation
+
+        except Exception as e:
+            logger.error(
+                f"Combined validation failed: {type(e).__name__}: {e}", exc_info=True
+            )
+            error_report = ValidationReport(
+                is_valid=False,
+                issues=[
+                    ValidationIssue(
+                        severity="CRITICAL",
+                        category="VALIDATION_ERROR",
+                        message=f"Validation system error: {str(e)}",
+                        suggested_fix="Check validator configuration and API availability",
+                    )
+                ],
+                overall_assessment="Validation failed due to system error",
+                confidence_score=0.0,
+            )
+            return error_report, error_report.model_copy(deep=True)
+
+    def _format_schema_info(
+        self,
+        manifests: Dict[str, Dict[str, Any]],
+        dsl: Optional[EnterpriseControlDSL] = None,
+        dsl_json: Optional[str] = None,
+    ) -> str:
+        """
+        Formats manifest schema info for LLM consumption.
+
+        When a DSL is provided, only the datasets it actually references are
+        included, and each column list is narrowed to the columns named in
+        the DSL — most controls touch 1-3 datasets, so this cuts the schema
+        portion of the prompt to a fraction of the full dump.
+        """
+        if dsl is not None:
+            used_aliases = {dsl.population.base_dataset}
+            for step in dsl.population.steps:
+                if step.action.operation == "join_left":
+                    used_aliases.add(step.action.left_dataset)
+                    used_aliases.add(step.action.right_dataset)
+            for binding in dsl.ontology_bindings:
+                used_aliases.add(binding.dataset_alias)
+
+            pruned = {
+                alias: meta
+                for alias, meta in manifests.items()
+                if alias in used_aliases
+            }
+            # Fall back to the full dump if the DSL aliases don't line up
+            # with the manifests (e.g. hallucinated alias) - the validator
+            # should then see everything to flag the mismatch.
+            if pruned:
+                if dsl_json is None:
+                    dsl_json = dsl.model_json.decode()
+                manifests = {
+                    alias: self._prune_manifest_columns(meta, dsl_json)
+                    for alias, meta in pruned.items()
+                }
+
+        # One dense line per dataset: the model doesn't need indentation or
+        # blank separators, and the compact encoding is ~2-3x fewer tokens.
         schema_lines = []
         for alias, meta in manifests.items():
             cols = meta.get("columns", [])
-            schema_lines.append(f"Dataset: {alias}")
-            schema_lines.append(f"  Columns: {', '.join(cols)}")
-            schema_lines.append(f"  Rows: {meta.get('row_count', 'unknown')}")
-            schema_lines.append("")
+            if len(cols) > 50:
+                col_list = ",".join(cols[:50]) + f",…+{len(cols) - 50} more"
+            else:
+                col_list = ",".join(cols)
+            schema_lines.append(
+                f"{alias}({meta.get('row_count', '?')} rows): {col_list}"
+            )
         return "\n".join(schema_lines)
 
+    @staticmethod
+    def _prune_manifest_columns(
+        meta: Dict[str, Any], dsl_json: str
+    ) -> Dict[str, Any]:
+        """Narrows a manifest's column list to columns mentioned in the DSL"""
+        cols = meta.get("columns", [])
+        used_cols = [c for c in cols if c in dsl_json]
+        if not used_cols:
+            return meta
+        return {**meta, "columns": used_cols}
+
     def _create_dsl_summary(self, dsl: EnterpriseControlDSL) -> str:
         """Creates a concise DSL summary for SQL validation context"""
         summary = [
@@ -3,8 +3,12 @@ SQL Compiler Module
 Translates DSL to DuckDB SQL with proper CTE chaining and value escaping
 """
 
-from datetime import datetime
-from typing import Any, Dict, List
+import functools
+import hashlib
+import io
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Dict, List, Optional, Tuple
 
 from src.models.dsl import (
     AggregationAssertion,
@@ -23,13 +27,82 @@ from src.utils.logging_config import get_logger
 # Get logger for this module
 logger = get_logger(__name__)
 
+# Compiled-SQL template cache. compile_to_sql is pure with respect to the
+# DSL content, the manifest column metadata, and the parameterize flag -
+# only the parquet paths vary run to run. We cache the generated SQL with
+# each path swapped for a $PATH_<alias>$ token (plus the bound params) and
+# re-substitute the per-run paths on a hit, skipping the whole compile.
+_TEMPLATE_CACHE: Dict[str, Tuple[str, tuple]] = {}
+_TEMPLATE_CACHE_MAX = 256
+
+
+def _quote_str(value: str) -> str:
+    """Escapes and quotes a string literal (O'Connor -> 'O''Connor')"""
+    return "'" + value.replace("'", "''") + "'"
+
+
+@functools.lru_cache(maxsize=1024)
+def _normalize_field_name(field: str) -> str:
+    """
+    Strip dataset prefix from field names.
+    Example: 'wall_cross_register_sheet1.employee_id' -> 'employee_id'
+
+    This is necessary because after joins, columns are accessed by their base name,
+    not dataset.column notation.
+
+    Memoized: a compile calls this dozens of times on the same handful of
+    dotted names, and rpartition returns a fixed 3-tuple instead of the
+    list split() allocates.
+    """
+    return field.rpartition(".")[2]
+
 
 class ControlCompiler:
     """Compiles DSL into DuckDB SQL with exception detection logic"""
 
-    def __init__(self, dsl: EnterpriseControlDSL):
+    # Operator maps hoisted to class scope - building a fresh dict literal
+    # per call was pure allocation overhead for controls with many assertions
+    _COMPARISON_OP_MAP = {
+        "eq": "=",
+        "neq": "!=",
+        "gt": ">",
+        "lt": "<",
+        "gte": ">=",
+        "lte": "<=",
+    }
+    _VALUE_MATCH_OP_MAP = {
+        **_COMPARISON_OP_MAP,
+        "in": "IN",
+        "not_in": "NOT IN",
+    }
+    _FILTER_OPS = frozenset(
+        ("filter_comparison", "filter_in_list", "filter_is_null")
+    )
+    # Join CTE skeleton pre-built at class load; %-substitution fills all
+    # slots in one C-level pass per join instead of assembling the fragment
+    # from nested f-string pieces
+    _JOIN_CTE_TMPL = (
+        "%s %s (\n"
+        "    SELECT %s.*,\n"
+        "           %s,\n"
+        "           %s\n"
+        "    FROM %s\n"
+        "    LEFT JOIN %s AS right_tbl\n"
+        "    ON %s\n"
+        ")"
+    )
+
+    def __init__(self, dsl: EnterpriseControlDSL, parameterize: bool = False):
         logger.debug(f"Initializing ControlCompiler for {dsl.governance.control_id}")
         self.dsl = dsl
+        # When parameterize=True, values are emitted as '?' placeholders and
+        # collected in self.params (in placeholder order) so the caller can
+        # run conn.execute(sql, params). DuckDB can then reuse the prepared
+        # plan across executions, and no literal ever reaches the SQL text.
+        # The default keeps inlined literals for EXPLAIN validation and the
+        # audit ledger, where the stored query must be self-contained.
+        self.parameterize = parameterize
+        self.params: List[Any] = []
         self.population_filters: List[str] = []  # MUST be true (AND)
         self.assertion_exceptions: List[
             str
@@ -37,20 +110,35 @@ class ControlCompiler:
         self.having_conditions: List[str] = []
         self.group_by_fields: List[str] = []
         self.cte_fragments: List[str] = []
+        self._referenced_fields = None  # lazily built by _collect_referenced_fields
+        # Set by _build_population_cte for the late-materialization rewrite
+        self._base_path: str = ""
+        self._base_scan_where: str = ""
+        # Set by _build_population_cte so derive_population_count_sql can
+        # reuse the built CTE chain without a second compile
+        self._final_alias: str = ""
+        self._filter_param_count = 0
+        # When set (via compile_to_sql_with_population), row-level queries
+        # carry a __pop_total window count so the engine gets the population
+        # size without a second round-trip over the same parquet scan
+        self._include_pop_total = False
+        # When set (count path), the CTE chain only has to support COUNT(*),
+        # so projections can shrink to filter columns and join keys
+        self._count_only = False
+        # Type-to-handler table for row-level assertions: a single dict
+        # lookup on type(assertion) replaces the isinstance chain per
+        # assertion. Aggregations are handled separately since they also
+        # populate GROUP BY state.
+        self._row_assertion_dispatch = {
+            ValueMatchAssertion: self._compile_value_match,
+            TemporalSequenceAssertion: self._compile_temporal_sequence,
+            TemporalDateMathAssertion: self._compile_temporal_date_math,
+            ColumnComparisonAssertion: self._compile_column_comparison,
+        }
 
-    @staticmethod
-    def _normalize_field_name(field: str) -> str:
-        """
-        Strip dataset prefix from field names.
-        Example: 'wall_cross_register_sheet1.employee_id' -> 'employee_id'
-
-        This is necessary because after joins, columns are accessed by their base name,
-        not dataset.column notation.
-        """
-        if "." in field:
-            # Return everything after the last dot
-            return field.split(".")[-1]
-        return field
+    # Kept as a class attribute so existing call sites (and any external
+    # callers) keep working; the cached module-level function does the work.
+    _normalize_field_name = staticmethod(_normalize_field_name)
 
     def compile_to_sql(self, parquet_manifests: Dict[str, Dict[str, Any]]) -> str:
         """
@@ -62,6 +150,19 @@ class ControlCompiler:
         Returns:
             DuckDB SQL query string
         """
+        # Step 0: Template cache hit - same DSL + schema compiled before,
+        # only the parquet paths need substituting
+        cache_key = self._template_cache_key(parquet_manifests)
+        cached = _TEMPLATE_CACHE.get(cache_key)
+        if cached is not None:
+            template, params = cached
+            self.params = self._untokenize_params(params, parquet_manifests)
+            sql = template
+            for alias, meta in parquet_manifests.items():
+                sql = sql.replace(f"$PATH_{alias}$", meta["parquet_path"])
+            logger.debug(f"SQL template cache hit for {self.dsl.governance.control_id}")
+            return sql
+
         # Step 1: Build population CTE with proper chaining
         final_population_alias = self._build_population_cte(parquet_manifests)
 
@@ -72,7 +173,161 @@ class ControlCompiler:
         sampling_clause = self._build_sampling_clause()
 
         # Step 4: Construct final query
-        return self._construct_query(final_population_alias, sampling_clause)
+        sql = self._construct_query(final_population_alias, sampling_clause)
+
+        # Step 5: Tokenize paths and store the template for reuse. In
+        # parameterized mode the paths live in self.params rather than the
+        # SQL text, so they are tokenized there too.
+        template = sql
+        for alias, meta in parquet_manifests.items():
+            template = template.replace(meta["parquet_path"], f"$PATH_{alias}$")
+        if len(_TEMPLATE_CACHE) >= _TEMPLATE_CACHE_MAX:
+            _TEMPLATE_CACHE.pop(next(iter(_TEMPLATE_CACHE)))
+        _TEMPLATE_CACHE[cache_key] = (
+            template,
+            self._tokenize_params(self.params, parquet_manifests),
+        )
+
+        return sql
+
+    def compile_to_sql_with_population(
+        self, parquet_manifests: Dict[str, Dict[str, Any]]
+    ) -> str:
+        """
+        Like compile_to_sql, but row-level queries additionally return a
+        __pop_total column holding the post-filter population count (via
+        COUNT(*) OVER () evaluated before the exception predicate). The
+        caller can then skip the separate population-count query whenever
+        at least one exception row comes back. Aggregation and sampled
+        late-materialized queries are returned unchanged - callers detect
+        the column's absence and fall back.
+        """
+        self._include_pop_total = True
+        try:
+            return self.compile_to_sql(parquet_manifests)
+        finally:
+            self._include_pop_total = False
+
+    def compile_population_count_sql(
+        self, parquet_manifests: Dict[str, Dict[str, Any]]
+    ) -> str:
+        """
+        Builds the standalone population-count query (post-filter, post-join
+        row count over the same CTE chain as the main query). Served from
+        the module-level template cache on repeat compilations, so refreshed
+        parquet runs of the same control only pay a path substitution.
+        """
+        cache_key = "count:" + self._template_cache_key(parquet_manifests)
+        cached = _TEMPLATE_CACHE.get(cache_key)
+        if cached is not None:
+            template, params = cached
+            self.params = self._untokenize_params(params, parquet_manifests)
+            sql = template
+            for alias, meta in parquet_manifests.items():
+                sql = sql.replace(f"$PATH_{alias}$", meta["parquet_path"])
+            return sql
+
+        self._count_only = True
+        try:
+            final_alias = self._build_population_cte(parquet_manifests)
+        finally:
+            self._count_only = False
+        cte_sql = ", ".join(self.cte_fragments)
+        if self.population_filters:
+            where_clause = " AND ".join(self.population_filters)
+            sql = (
+                f"WITH {cte_sql}\n"
+                f"SELECT COUNT(*) FROM {final_alias}\n"
+                f"WHERE {where_clause}"
+            )
+        else:
+            sql = f"WITH {cte_sql}\nSELECT COUNT(*) FROM {final_alias}"
+
+        template = sql
+        for alias, meta in parquet_manifests.items():
+            template = template.replace(meta["parquet_path"], f"$PATH_{alias}$")
+        if len(_TEMPLATE_CACHE) >= _TEMPLATE_CACHE_MAX:
+            _TEMPLATE_CACHE.pop(next(iter(_TEMPLATE_CACHE)))
+        _TEMPLATE_CACHE[cache_key] = (
+            template,
+            self._tokenize_params(self.params, parquet_manifests),
+        )
+
+        return sql
+
+    @staticmethod
+    def _tokenize_params(
+        params: List[Any], manifests: Dict[str, Dict[str, Any]]
+    ) -> tuple:
+        """
+        Swaps parquet paths inside a param list for $PATH_<alias>$ tokens
+        before the list enters the template cache - path params are the only
+        run-to-run variable, exactly like paths in the SQL text.
+        """
+        path_to_token = {
+            meta["parquet_path"]: f"$PATH_{alias}$"
+            for alias, meta in manifests.items()
+        }
+        return tuple(
+            path_to_token.get(p, p) if isinstance(p, str) else p for p in params
+        )
+
+    @staticmethod
+    def _untokenize_params(
+        params: tuple, manifests: Dict[str, Dict[str, Any]]
+    ) -> List[Any]:
+        """Substitutes the current run's parquet paths back into cached params"""
+        token_to_path = {
+            f"$PATH_{alias}$": meta["parquet_path"]
+            for alias, meta in manifests.items()
+        }
+        return [
+            token_to_path.get(p, p) if isinstance(p, str) else p for p in params
+        ]
+
+    def derive_population_count_sql(
+        self,
+    ) -> Optional[Tuple[str, List[Any]]]:
+        """
+        Reuses the CTE chain built by the last compile_to_sql call to
+        produce the population-count query without compiling a second time.
+        The filter placeholders are a prefix of self.params (assertion
+        values are appended after the chain is built), so the matching
+        parameter slice comes back alongside the SQL.
+
+        Returns None when there is no built state to reuse - e.g. the main
+        compile was a template-cache hit - in which case
+        compile_population_count_sql (itself cached) is the fallback.
+        """
+        if not self.cte_fragments:
+            return None
+        cte_sql = ", ".join(self.cte_fragments)
+        if self.population_filters:
+            where_clause = " AND ".join(self.population_filters)
+            sql = (
+                f"WITH {cte_sql}\n"
+                f"SELECT COUNT(*) FROM {self._final_alias}\n"
+                f"WHERE {where_clause}"
+            )
+        else:
+            sql = f"WITH {cte_sql}\nSELECT COUNT(*) FROM {self._final_alias}"
+        return sql, self.params[: self._filter_param_count]
+
+    def _template_cache_key(self, manifests: Dict[str, Dict[str, Any]]) -> str:
+        """
+        Cache key covering everything the generated SQL depends on apart
+        from the parquet paths: the full DSL content, each manifest's
+        column metadata (which drives projection lists), and whether we
+        are emitting placeholders or literals.
+        """
+        h = hashlib.blake2b(digest_size=16)
+        h.update(self.dsl.model_json)
+        for alias in sorted(manifests):
+            h.update(alias.encode())
+            h.update(repr(manifests[alias].get("columns")).encode())
+        h.update(b"p" if self.parameterize else b"l")
+        h.update(b"t" if self._include_pop_total else b"f")
+        return h.hexdigest()
 
     def _build_population_cte(self, manifests: Dict[str, Dict[str, Any]]) -> str:
         """
@@ -81,84 +336,277 @@ class ControlCompiler:
         """
         base_alias = self.dsl.population.base_dataset
         base_path = manifests[base_alias]["parquet_path"]
+        has_aggregation = any(
+            isinstance(a, (AggregationSumAssertion, AggregationAssertion))
+            for a in self.dsl.assertions
+        )
 
-        # Start with base dataset
-        current_cte = f"base AS (SELECT * FROM read_parquet('{base_path}'))"
+        # Classify filter steps: filters on base-dataset columns are pushed
+        # into the base CTE so DuckDB's Parquet reader can use row-group
+        # min/max stats (zone maps) to skip row groups at scan time. A filter
+        # on a base column commutes with LEFT JOIN, so this is semantics-
+        # preserving. Filters on joined-table columns stay in the final WHERE:
+        # pushing them inside the join subquery would turn dropped rows into
+        # NULL-padded matches and silently change the population.
+        base_filter_actions = []
+        deferred_filter_actions = []
+        filter_ops = self._FILTER_OPS
+        seen_join = False
+        for step in self.dsl.population.steps:
+            action = step.action
+            if action.operation in filter_ops:
+                prefix = action.field.rpartition(".")[0]
+                if prefix == base_alias or (not prefix and not seen_join):
+                    base_filter_actions.append(action)
+                else:
+                    deferred_filter_actions.append(action)
+            elif action.operation == "join_left":
+                seen_join = True
+
+        # In parameterized mode the parquet paths themselves are bound as
+        # parameters: the SQL text then stays byte-identical across manifest
+        # refreshes of the same control, so DuckDB sees one statement shape
+        # it can reuse, and the template cache needs no path substitution.
+        # The base path binds first - read_parquet(?) is the first
+        # placeholder in the emitted text.
+        if self.parameterize:
+            self.params.append(base_path)
+            base_source = "read_parquet(?)"
+        else:
+            base_source = f"read_parquet('{base_path}')"
+
+        # Compile pushed filters next so that, in parameterized mode, their
+        # params precede all later placeholders (the base CTE is the first
+        # SQL text emitted).
+        base_conditions = [self._compile_filter_action(a) for a in base_filter_actions]
+
+        # Aggregation queries only ever emit group fields and aggregates, so
+        # the wide row payload is dead weight through every join and vector
+        # pipeline. When the base manifest carries column metadata, narrow
+        # the base CTE to the referenced columns plus join keys. Row-level
+        # queries keep * because the exception sample returns full rows.
+        base_select = "*"
+        base_columns = manifests[base_alias].get("columns")
+        if base_columns is not None and (has_aggregation or self._count_only):
+            if self._count_only:
+                # COUNT(*) only needs the filter columns to survive the chain
+                needed = {
+                    self._normalize_field_name(step.action.field)
+                    for step in self.dsl.population.steps
+                    if step.action.operation in self._FILTER_OPS
+                }
+            else:
+                needed = set(self._collect_referenced_fields())
+            for step in self.dsl.population.steps:
+                if step.action.operation == "join_left":
+                    needed.update(
+                        self._normalize_field_name(k) for k in step.action.left_keys
+                    )
+            projected = [c for c in base_columns if c in needed]
+            if projected:
+                base_select = ", ".join(projected)
+            elif self._count_only and not seen_join:
+                # No filters or joins touch the base table: a constant
+                # projection is enough to count rows
+                base_select = "1 AS _row"
+
+        # Start with base dataset (with pushed-down predicates, if any)
+        self._base_path = base_path
+        if base_conditions:
+            base_where = " AND ".join(base_conditions)
+            self._base_scan_where = base_where
+            current_cte = (
+                f"base AS (SELECT {base_select} FROM {base_source} "
+                f"WHERE {base_where})"
+            )
+        else:
+            current_cte = f"base AS (SELECT {base_select} FROM {base_source})"
         self.cte_fragments.append(current_cte)
 
+        # Pin join results with AS MATERIALIZED when the chain is consumed
+        # more than once (multiple assertions, or aggregation re-reading the
+        # grouped population). Otherwise DuckDB may inline the CTE and
+        # re-execute the join - and its Parquet scans - per consumer.
+        materialize_joins = len(self.dsl.assertions) > 1 or has_aggregation
+        join_keyword = "AS MATERIALIZED" if materialize_joins else "AS"
+
         # Track the previous CTE alias for proper chaining (CRITICAL FIX)
         previous_alias = "base"
 
-        # Apply pipeline steps
-        for step in self.dsl.population.steps:
+        # Apply pipeline steps. Filters were classified above; the deferred
+        # ones are compiled after this loop so that, in parameterized mode,
+        # join path params (CTE text) precede filter params (final WHERE).
+        for step_idx, step in enumerate(self.dsl.population.steps):
             action = step.action
 
-            if action.operation == "filter_comparison":
-                # Filters are applied in WHERE clause, not in CTE
-                cond = self._compile_filter_comparison(action)
-                self.population_filters.append(cond)
-
-            elif action.operation == "filter_in_list":
-                cond = self._compile_filter_in_list(action)
-                self.population_filters.append(cond)
-
-            elif action.operation == "filter_is_null":
-                cond = self._compile_filter_is_null(action)
-                self.population_filters.append(cond)
-
-            elif action.operation == "join_left":
-                right_path = manifests[action.right_dataset]["parquet_path"]
+            if action.operation == "join_left":
+                right_manifest = manifests[action.right_dataset]
+                right_path = right_manifest["parquet_path"]
+                if self.parameterize:
+                    self.params.append(right_path)
+                    right_source = "read_parquet(?)"
+                else:
+                    right_source = f"read_parquet('{right_path}')"
 
                 # Build composite join conditions (supports multiple keys)
-                join_conditions = []
-                for l_key, r_key in zip(action.left_keys, action.right_keys):
-                    join_conditions.append(
-                        f"{previous_alias}.{l_key} = right_tbl.{r_key}"
-                    )
-
-                on_clause = " AND ".join(join_conditions)
+                on_clause = " AND ".join(
+                    f"{previous_alias}.{l_key} = right_tbl.{r_key}"
+                    for l_key, r_key in zip(action.left_keys, action.right_keys)
+                )
 
                 # CRITICAL FIX: Namespace the aliased keys with step_id to prevent collisions in chained joins.
                 # When multiple joins use the same key (e.g., employee_id), a generic "right_employee_id" would
                 # be created multiple times, causing DuckDB to crash with "Duplicate Column Name".
                 # By using step_id (e.g., "join_service_tickets_employee_id"), each join gets a unique alias.
-                exclude_keys = ", ".join(action.right_keys)
                 aliased_keys = ", ".join(
                     [f"right_tbl.{k} AS {step.step_id}_{k}" for k in action.right_keys]
                 )
 
-                join_cte = f"""{step.step_id} AS (
-    SELECT {previous_alias}.*,
-           right_tbl.* EXCLUDE ({exclude_keys}),
-           {aliased_keys}
-    FROM {previous_alias}
-    LEFT JOIN read_parquet('{right_path}') AS right_tbl
-    ON {on_clause}
-)"""
+                # Projection pushdown: when the manifest tells us the right
+                # table's columns, select only the ones the DSL actually
+                # references (plus the namespaced keys) instead of
+                # right_tbl.* — DuckDB then reads just those column chunks
+                # from the Parquet file. Without column metadata, fall back
+                # to the old EXCLUDE form.
+                right_columns = right_manifest.get("columns")
+                if right_columns is not None:
+                    if self._count_only:
+                        referenced = {
+                            self._normalize_field_name(s.action.field)
+                            for s in self.dsl.population.steps
+                            if s.action.operation in self._FILTER_OPS
+                        }
+                    else:
+                        referenced = set(self._collect_referenced_fields())
+                    # A later join may read its left keys off THIS CTE's
+                    # output (chained joins), so those columns must survive
+                    # the projection even when nothing else references them
+                    referenced.update(
+                        self._normalize_field_name(k)
+                        for later in self.dsl.population.steps[step_idx + 1 :]
+                        if later.action.operation == "join_left"
+                        for k in later.action.left_keys
+                    )
+                    projected = [
+                        c
+                        for c in right_columns
+                        if c in referenced and c not in action.right_keys
+                    ]
+                    right_select = ", ".join(
+                        [f"right_tbl.{c}" for c in projected] or ["1 AS _join_hit"]
+                    )
+                else:
+                    exclude_keys = ", ".join(action.right_keys)
+                    right_select = f"right_tbl.* EXCLUDE ({exclude_keys})"
+
+                join_cte = self._JOIN_CTE_TMPL % (
+                    step.step_id,
+                    join_keyword,
+                    previous_alias,
+                    right_select,
+                    aliased_keys,
+                    previous_alias,
+                    right_source,
+                    on_clause,
+                )
                 self.cte_fragments.append(join_cte)
                 # Update the pointer to current step for next iteration
                 previous_alias = step.step_id
 
+        # Cross-table filters stay in the final WHERE clause; compiled here,
+        # after the joins, so their placeholders follow the join path params
+        # just as their text follows the CTE chain
+        for action in deferred_filter_actions:
+            self.population_filters.append(self._compile_filter_action(action))
+
+        # Hoist date casts out of the assertion predicates: every
+        # TemporalDateMathAssertion used to emit CAST(field AS DATE) inline,
+        # re-casting per comparison. Cast each date field once here with
+        # SELECT * REPLACE so downstream predicates work on the typed column.
+        # The count-only chain skips this CTE: its narrowed projection drops
+        # the assertion date columns (REPLACE would fail to bind), and a
+        # cast cannot change COUNT(*).
+        date_cast_fields = dict.fromkeys(
+            self._normalize_field_name(f)
+            for a in self.dsl.assertions
+            if isinstance(a, TemporalDateMathAssertion)
+            for f in (a.base_date_field, a.target_date_field)
+        )
+        if date_cast_fields and not self._count_only:
+            replace_list = ", ".join(
+                f"CAST({f} AS DATE) AS {f}" for f in date_cast_fields
+            )
+            self.cte_fragments.append(
+                f"typed_dates AS (SELECT * REPLACE ({replace_list}) "
+                f"FROM {previous_alias})"
+            )
+            previous_alias = "typed_dates"
+
+        # Snapshot for derive_population_count_sql: every param emitted so
+        # far belongs to a filter (assertion params are appended later by
+        # _compile_assertions), and this alias is what COUNT(*) reads from
+        self._final_alias = previous_alias
+        self._filter_param_count = len(self.params)
+
         return previous_alias
 
+    def _collect_referenced_fields(self) -> set:
+        """
+        Walks the DSL once and returns the set of normalized column names
+        referenced by filters, assertions, and group-bys. Used to build
+        explicit projection lists so DuckDB only reads the Parquet column
+        chunks the control actually touches.
+        """
+        if self._referenced_fields is not None:
+            return self._referenced_fields
+
+        fields = set()
+        for step in self.dsl.population.steps:
+            action = step.action
+            if hasattr(action, "field"):
+                fields.add(self._normalize_field_name(action.field))
+
+        for assertion in self.dsl.assertions:
+            if isinstance(assertion, ValueMatchAssertion):
+                fields.add(self._normalize_field_name(assertion.field))
+            elif isinstance(assertion, TemporalSequenceAssertion):
+                fields.update(
+                    self._normalize_field_name(e) for e in assertion.event_chain
+                )
+            elif isinstance(assertion, TemporalDateMathAssertion):
+                fields.add(self._normalize_field_name(assertion.base_date_field))
+                fields.add(self._normalize_field_name(assertion.target_date_field))
+            elif isinstance(assertion, ColumnComparisonAssertion):
+                fields.add(self._normalize_field_name(assertion.left_field))
+                fields.add(self._normalize_field_name(assertion.right_field))
+            elif isinstance(assertion, (AggregationSumAssertion, AggregationAssertion)):
+                fields.add(self._normalize_field_name(assertion.metric_field))
+                fields.update(
+                    self._normalize_field_name(f) for f in assertion.group_by_fields
+                )
+
+        self._referenced_fields = fields
+        return fields
+
+    def _compile_filter_action(self, action) -> str:
+        """Dispatches a filter action to its specific compile method"""
+        if action.operation == "filter_comparison":
+            return self._compile_filter_comparison(action)
+        elif action.operation == "filter_in_list":
+            return self._compile_filter_in_list(action)
+        else:
+            return self._compile_filter_is_null(action)
+
     def _compile_filter_comparison(self, action: FilterComparison) -> str:
         """Compiles FilterComparison to SQL condition"""
-        op_map = {
-            "eq": "=",
-            "neq": "!=",
-            "gt": ">",
-            "lt": "<",
-            "gte": ">=",
-            "lte": "<=",
-        }
-        sql_op = op_map[action.operator]
+        sql_op = self._COMPARISON_OP_MAP[action.operator]
         field = self._normalize_field_name(action.field)
-        return f"{field} {sql_op} {self._quote_value(action.value)}"
+        return f"{field} {sql_op} {self._render_value(action.value)}"
 
     def _compile_filter_in_list(self, action: FilterInList) -> str:
         """Compiles FilterInList to SQL IN condition"""
         field = self._normalize_field_name(action.field)
-        values_str = ", ".join([self._quote_value(v) for v in action.values])
+        values_str = self._render_value_list(action.values)
         return f"{field} IN ({values_str})"
 
     def _compile_filter_is_null(self, action: FilterIsNull) -> str:
@@ -171,27 +619,52 @@ class ControlCompiler:
 
     def _compile_assertions(self) -> None:
         """Routes assertions to appropriate SQL clauses"""
-        for assertion in self.dsl.assertions:
-            if isinstance(assertion, ValueMatchAssertion):
-                # Row-level assertion → WHERE clause
-                cond = self._compile_value_match(assertion)
-                # CRITICAL FIX: Use IS NOT TRUE instead of NOT to handle NULL properly
-                # NOT (NULL) = NULL (drops row from result), but (NULL) IS NOT TRUE = TRUE (catches the exception)
-                self.assertion_exceptions.append(f"({cond}) IS NOT TRUE")
-
-            elif isinstance(assertion, TemporalSequenceAssertion):
-                # Temporal sequence → WHERE clause
-                cond = self._compile_temporal_sequence(assertion)
-                self.assertion_exceptions.append(f"({cond}) IS NOT TRUE")
+        # Pre-pass: collapse scalar eq/neq ValueMatch assertions that share a
+        # field into one IN / NOT IN membership test, so DuckDB evaluates a
+        # single list probe per row instead of N separate comparisons. N eq
+        # assertions on one field are an allowed-value set (no row can equal
+        # two different values at once), which is exactly field IN (...).
+        groups: Dict[tuple, List[ValueMatchAssertion]] = {}
+        for a in self.dsl.assertions:
+            if (
+                isinstance(a, ValueMatchAssertion)
+                and a.operator in ("eq", "neq")
+                and a.expected_value is not None
+                and not isinstance(a.expected_value, list)
+            ):
+                key = (
+                    self._normalize_field_name(a.field),
+                    a.operator,
+                    getattr(a, "ignore_case_and_space", True),
+                    isinstance(a.expected_value, str),
+                )
+                groups.setdefault(key, []).append(a)
+        grouped = {
+            id(a): key
+            for key, members in groups.items()
+            if len(members) > 1
+            for a in members
+        }
+        emitted_groups = set()
 
-            elif isinstance(assertion, TemporalDateMathAssertion):
-                # Temporal date math → WHERE clause
-                cond = self._compile_temporal_date_math(assertion)
+        for assertion in self.dsl.assertions:
+            group_key = grouped.get(id(assertion))
+            if group_key is not None:
+                if group_key in emitted_groups:
+                    continue
+                emitted_groups.add(group_key)
+                values = [m.expected_value for m in groups[group_key]]
+                cond = self._compile_value_match_group(group_key, values)
                 self.assertion_exceptions.append(f"({cond}) IS NOT TRUE")
-
-            elif isinstance(assertion, ColumnComparisonAssertion):
-                # Column-to-column comparison → WHERE clause
-                cond = self._compile_column_comparison(assertion)
+                continue
+
+            # Row-level assertions → WHERE clause, resolved with one dict
+            # lookup on the concrete type instead of an isinstance chain.
+            # CRITICAL FIX: Use IS NOT TRUE instead of NOT to handle NULL properly
+            # NOT (NULL) = NULL (drops row from result), but (NULL) IS NOT TRUE = TRUE (catches the exception)
+            compile_fn = self._row_assertion_dispatch.get(type(assertion))
+            if compile_fn is not None:
+                cond = compile_fn(assertion)
                 self.assertion_exceptions.append(f"({cond}) IS NOT TRUE")
 
             elif isinstance(assertion, (AggregationSumAssertion, AggregationAssertion)):
@@ -205,6 +678,28 @@ class ControlCompiler:
                 ]
                 self.group_by_fields.extend(normalized_fields)
 
+    def _compile_value_match_group(self, key: tuple, values: List[Any]) -> str:
+        """
+        Compiles a group of same-field eq/neq ValueMatchAssertions into a
+        single membership test: eq -> field IN (...), neq -> field NOT IN (...).
+        Case-insensitive string groups keep the TRIM(UPPER(...)) wrapping on
+        both the field and each list value.
+        """
+        field, operator, ignore_case, is_str = key
+        sql_op = "IN" if operator == "eq" else "NOT IN"
+        unique_values = list(dict.fromkeys(values))
+        if ignore_case and is_str:
+            if self.parameterize:
+                # Normalize the constants at compile time and bind them plain
+                self.params.extend(v.strip(" ").upper() for v in unique_values)
+                rendered = ", ".join(["?"] * len(unique_values))
+            else:
+                rendered = ", ".join(
+                    [f"TRIM(UPPER({self._quote_value(v)}))" for v in unique_values]
+                )
+            return f"TRIM(UPPER(CAST({field} AS VARCHAR))) {sql_op} ({rendered})"
+        return f"{field} {sql_op} ({self._render_value_list(unique_values)})"
+
     def _compile_value_match(self, assertion: ValueMatchAssertion) -> str:
         """Translates ValueMatchAssertion to SQL condition"""
         field = self._normalize_field_name(assertion.field)
@@ -223,23 +718,12 @@ class ControlCompiler:
                 )
 
         # Map DSL operators to SQL operators
-        op_map = {
-            "eq": "=",
-            "neq": "!=",
-            "gt": ">",
-            "lt": "<",
-            "gte": ">=",
-            "lte": "<=",
-            "in": "IN",
-            "not_in": "NOT IN",
-        }
-
-        sql_op = op_map[operator]
+        sql_op = self._VALUE_MATCH_OP_MAP[operator]
 
         # Handle list values for IN operator
         if operator in ["in", "not_in"]:
             if isinstance(value, list):
-                values_str = ", ".join([self._quote_value(v) for v in value])
+                values_str = self._render_value_list(value)
                 return f"{field} {sql_op} ({values_str})"
 
         # CRITICAL FIX: Handle case-insensitive string comparison
@@ -248,46 +732,43 @@ class ControlCompiler:
             and isinstance(value, str)
             and operator not in ["in", "not_in"]
         ):
-            # Trim and uppercase both sides for string comparisons
+            # Trim and uppercase both sides for string comparisons. In
+            # parameterized mode, normalize the constant in Python and bind
+            # it directly - the TRIM(UPPER(...)) on the literal side is a
+            # compile-time-known expression, so there is no reason to ship
+            # it to DuckDB per query.
+            if self.parameterize:
+                self.params.append(value.strip(" ").upper())
+                return f"TRIM(UPPER(CAST({field} AS VARCHAR))) {sql_op} ?"
             return f"TRIM(UPPER(CAST({field} AS VARCHAR))) {sql_op} TRIM(UPPER({self._quote_value(value)}))"
 
         # Handle scalar values
-        return f"{field} {sql_op} {self._quote_value(value)}"
+        return f"{field} {sql_op} {self._render_value(value)}"
 
     def _compile_temporal_sequence(self, assertion: TemporalSequenceAssertion) -> str:
         """Translates TemporalSequenceAssertion to SQL condition"""
         # Build chain: event1 < event2 < event3 ...
-        conditions = []
-        for i in range(len(assertion.event_chain) - 1):
-            event1 = self._normalize_field_name(assertion.event_chain[i])
-            event2 = self._normalize_field_name(assertion.event_chain[i + 1])
-            conditions.append(f"{event1} < {event2}")
-
-        return " AND ".join(conditions)
+        chain = [self._normalize_field_name(e) for e in assertion.event_chain]
+        return " AND ".join(
+            f"{event1} < {event2}" for event1, event2 in zip(chain, chain[1:])
+        )
 
     def _compile_temporal_date_math(self, assertion: TemporalDateMathAssertion) -> str:
         """Translates TemporalDateMathAssertion to SQL with INTERVAL arithmetic"""
-        op_map = {"gt": ">", "lt": "<", "eq": "=", "gte": ">=", "lte": "<="}
-        sql_op = op_map[assertion.operator]
+        sql_op = self._COMPARISON_OP_MAP[assertion.operator]
 
-        # CRITICAL FIX: Cast date fields to DATE type to handle VARCHAR/string dates
-        # Also normalize field names to strip dataset prefixes
+        # Normalize field names to strip dataset prefixes. The DATE casts for
+        # VARCHAR/string dates are hoisted into the typed_dates CTE by
+        # _build_population_cte, so they run once per row instead of per
+        # comparison here.
         base_field = self._normalize_field_name(assertion.base_date_field)
         target_field = self._normalize_field_name(assertion.target_date_field)
-        # Translates to: CAST(edd_date AS DATE) <= CAST(onboarding_date AS DATE) + INTERVAL 14 DAY
-        return f"CAST({base_field} AS DATE) {sql_op} CAST({target_field} AS DATE) + INTERVAL {assertion.offset_days} DAY"
+        # Translates to: edd_date <= onboarding_date + INTERVAL 14 DAY
+        return f"{base_field} {sql_op} {target_field} + INTERVAL {assertion.offset_days} DAY"
 
     def _compile_column_comparison(self, assertion: ColumnComparisonAssertion) -> str:
         """Translates ColumnComparisonAssertion to SQL (compares two columns)"""
-        op_map = {
-            "eq": "=",
-            "neq": "!=",
-            "gt": ">",
-            "lt": "<",
-            "gte": ">=",
-            "lte": "<=",
-        }
-        sql_op = op_map[assertion.operator]
+        sql_op = self._COMPARISON_OP_MAP[assertion.operator]
 
         # Normalize both field names to strip dataset prefixes
         left_field = self._normalize_field_name(assertion.left_field)
@@ -301,8 +782,7 @@ class ControlCompiler:
         operator = assertion.operator
         threshold = assertion.threshold
 
-        op_map = {"gt": ">", "lt": "<", "eq": "=", "gte": ">=", "lte": "<="}
-        sql_op = op_map[operator]
+        sql_op = self._COMPARISON_OP_MAP[operator]
 
         # Determine aggregation function
         if isinstance(assertion, AggregationAssertion):
@@ -324,19 +804,56 @@ class ControlCompiler:
         )
 
         if sampling.sample_size:
+            # Exact row count requested - RESERVOIR is the only method that
+            # guarantees it (at the cost of reading every row)
             return f" TABLESAMPLE RESERVOIR({sampling.sample_size} ROWS){seed_clause}"
         elif sampling.sample_percentage:
             pct = int(sampling.sample_percentage * 100)
-            return f" TABLESAMPLE RESERVOIR({pct}%){seed_clause}"
+            # Percentage sampling over a raw parquet scan can use SYSTEM
+            # (block-level Bernoulli), which skips whole row groups instead
+            # of reading every row to maintain reservoir invariants. Joined
+            # or filtered populations keep RESERVOIR: their sample is drawn
+            # from an intermediate result, so there are no blocks to skip
+            # and block sampling would be lumpy on small intermediates.
+            has_join = any(
+                step.action.operation == "join_left"
+                for step in self.dsl.population.steps
+            )
+            has_filters = bool(self._base_scan_where) or bool(self.population_filters)
+            method = "RESERVOIR" if has_join or has_filters else "SYSTEM"
+            return f" TABLESAMPLE {method}({pct}%){seed_clause}"
 
         return ""
 
     def _construct_query(
         self, final_population_alias: str, sampling_clause: str
     ) -> str:
-        """Assembles final SQL query"""
+        """
+        Assembles the final SQL query with a single StringIO buffer.
+        Writing fragments into one buffer avoids the intermediate string
+        allocations of chained f-string concatenation, which adds up when
+        compiling large control batches.
+        """
+        # Sampled, join-free, row-level controls use the late-materialization
+        # rewrite: find exception row-ids on a narrow scan first, then fetch
+        # the wide payload only for those rows.
+        if (
+            sampling_clause
+            and not self.having_conditions
+            and len(self.cte_fragments) == 1
+        ):
+            return self._construct_late_materialized_query(sampling_clause)
+
+        buf = io.StringIO()
+
         # Build CTE chain
-        cte_sql = "WITH " + ",\n".join(self.cte_fragments) if self.cte_fragments else ""
+        if self.cte_fragments:
+            buf.write("WITH ")
+            for i, fragment in enumerate(self.cte_fragments):
+                if i:
+                    buf.write(",\n")
+                buf.write(fragment)
+            buf.write("\n")
 
         # 1. Assemble Population Filters (AND)
         pop_clause = (
@@ -354,7 +871,10 @@ class ControlCompiler:
         # Build SELECT
         if self.having_conditions:
             # Aggregation query
-            group_fields = ", ".join(set(self.group_by_fields))
+            # dict.fromkeys dedupes in insertion order - set() ordering varies
+            # with PYTHONHASHSEED, which would make identical controls emit
+            # different SQL text and defeat the template cache
+            group_fields = ", ".join(dict.fromkeys(self.group_by_fields))
             having_clause = " AND ".join(self.having_conditions)
 
             # Find the metric field from assertions
@@ -366,25 +886,136 @@ class ControlCompiler:
                     metric_field = self._normalize_field_name(assertion.metric_field)
                     break
 
-            select_sql = f"""
-SELECT {group_fields}, 
-       COUNT(*) as exception_count,
-       SUM({metric_field}) as total_amount
-FROM {final_population_alias}
-WHERE {where_clause}
-GROUP BY {group_fields}
-HAVING {having_clause}"""
+            buf.write("\nSELECT ")
+            buf.write(group_fields)
+            buf.write(", \n       COUNT(*) as exception_count,\n       SUM(")
+            buf.write(str(metric_field))
+            buf.write(") as total_amount\nFROM ")
+            buf.write(final_population_alias)
+            buf.write("\nWHERE ")
+            buf.write(where_clause)
+            buf.write("\nGROUP BY ")
+            buf.write(group_fields)
+            buf.write("\nHAVING ")
+            buf.write(having_clause)
+        elif (
+            self._include_pop_total
+            and self.assertion_exceptions
+            and not sampling_clause
+        ):
+            # Row-level query fused with the population count: the window
+            # count runs over the rows passing the population filters, then
+            # the outer WHERE keeps only the exception rows. One scan serves
+            # both numbers. Placeholder order is preserved - population
+            # params surface in the inner WHERE, assertion params after.
+            buf.write("\nSELECT * FROM (\n")
+            buf.write("    SELECT *, COUNT(*) OVER () AS __pop_total\n")
+            buf.write("    FROM ")
+            buf.write(final_population_alias)
+            buf.write("\n    WHERE ")
+            buf.write(pop_clause)
+            buf.write("\n)\nWHERE ")
+            buf.write(" OR ".join(self.assertion_exceptions))
         else:
             # Row-level query
-            select_sql = f"""
-SELECT *
-FROM {final_population_alias}{sampling_clause}
-WHERE {where_clause}"""
+            buf.write("\nSELECT *\nFROM ")
+            buf.write(final_population_alias)
+            buf.write(sampling_clause)
+            buf.write("\nWHERE ")
+            buf.write(where_clause)
+
+        return buf.getvalue()
+
+    def _construct_late_materialized_query(self, sampling_clause: str) -> str:
+        """
+        Late-materialization rewrite for sampled row-level queries.
+
+        SELECT * forces DuckDB to project every column of every candidate
+        row before sampling and filtering. Instead, compute the exception
+        row ids over a scan that only reads the filtered columns (plus the
+        virtual file_row_number), then fetch the full payload just for the
+        matching rows via a semi-join on the row id.
+
+        Sampling semantics match the joined path: the sample is drawn from
+        the FILTERED population (filter-then-sample), then the assertion
+        predicates run over the sampled rows. Sampling the raw scan first
+        would silently shrink the tested population.
+        """
+        filter_conditions = []
+        if self._base_scan_where:
+            filter_conditions.append(f"({self._base_scan_where})")
+        if self.population_filters:
+            filter_conditions.append(f"({' AND '.join(self.population_filters)})")
+        exception_clause = (
+            " OR ".join(self.assertion_exceptions)
+            if self.assertion_exceptions
+            else "1=1"
+        )
 
-        if cte_sql:
-            return f"{cte_sql}\n{select_sql}"
+        path = self._base_path
+        if self.parameterize:
+            # The base path already sits at params[0] (bound when the base
+            # CTE was built); the outer scan is the last placeholder in this
+            # text, so the path binds once more at the end
+            scan = "read_parquet(?, file_row_number=true)"
+            self.params.append(path)
         else:
-            return select_sql
+            scan = f"read_parquet('{path}', file_row_number=true)"
+
+        if filter_conditions:
+            # Population filters go inside the sampled subquery so the
+            # sample is taken over the post-filter population
+            population = (
+                "(\n"
+                f"        SELECT * FROM {scan}\n"
+                f"        WHERE {' AND '.join(filter_conditions)}\n"
+                "    )"
+            )
+        else:
+            population = scan
+        return (
+            "WITH exception_rows AS MATERIALIZED (\n"
+            "    SELECT file_row_number AS row_id\n"
+            f"    FROM {population}"
+            f"{sampling_clause}\n"
+            f"    WHERE {exception_clause}\n"
+            ")\n"
+            "SELECT * EXCLUDE (file_row_number)\n"
+            f"FROM {scan}\n"
+            "WHERE file_row_number IN (SELECT row_id FROM exception_rows)"
+        )
+
+    def _render_value(self, value: Any) -> str:
+        """
+        Renders a value either as a '?' placeholder (parameterized mode,
+        appending the native Python object to self.params so DuckDB binds
+        it directly) or as an escaped SQL literal.
+        """
+        if self.parameterize:
+            self.params.append(value)
+            return "?"
+        return self._quote_value(value)
+
+    def _render_value_list(self, values: List[Any]) -> str:
+        """
+        Renders an IN-list body. In parameterized mode the values are
+        extended onto self.params in one call and the placeholders are
+        stamped out with a list-multiply, skipping per-value rendering.
+        """
+        if self.parameterize:
+            self.params.extend(values)
+            return ", ".join(["?"] * len(values))
+        # Monomorphic fast path: IN-list values almost always share one type
+        # (they come from the same DSL field), so resolve the formatting once
+        # and map it instead of re-running the isinstance cascade per element
+        if values:
+            t = type(values[0])
+            if all(type(v) is t for v in values):
+                if t is str:
+                    return ", ".join(map(_quote_str, values))
+                if t is int or t is float:
+                    return ", ".join(map(str, values))
+        return ", ".join([self._quote_value(v) for v in values])
 
     @staticmethod
     def _quote_value(value: Any) -> str:
@@ -394,12 +1025,28 @@ WHERE {where_clause}"""
         """
         if isinstance(value, str):
             # Escape single quotes (O'Connor -> O''Connor)
-            safe_val = value.replace("'", "''")
-            return f"'{safe_val}'"
+            return _quote_str(value)
         elif isinstance(value, datetime):
+            # Hand-formatted instead of isoformat(), which builds several
+            # intermediate strings per call. Same 'YYYY-MM-DDTHH:MM:SS' text.
+            v = value
+            if v.microsecond:
+                return (
+                    f"'{v.year:04d}-{v.month:02d}-{v.day:02d}T"
+                    f"{v.hour:02d}:{v.minute:02d}:{v.second:02d}"
+                    f".{v.microsecond:06d}'"
+                )
+            return (
+                f"'{v.year:04d}-{v.month:02d}-{v.day:02d}T"
+                f"{v.hour:02d}:{v.minute:02d}:{v.second:02d}'"
+            )
+        elif isinstance(value, date):
             return f"'{value.isoformat()}'"
         elif isinstance(value, bool):
             return "TRUE" if value else "FALSE"
+        elif isinstance(value, Decimal):
+            # Exact decimal text - avoids float round-tripping
+            return str(value)
         elif value is None:
             return "NULL"
         return str(value)
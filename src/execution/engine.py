@@ -3,10 +3,14 @@ Execution Engine Module
 DuckDB-based execution with disk streaming
 """
 
-from datetime import datetime
+import os
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
 from typing import Any, Dict
 
 import duckdb
+import pyarrow.parquet as pq
 
 from src.compiler.sql_compiler import ControlCompiler
 from src.models.dsl import EnterpriseControlDSL
@@ -22,13 +26,38 @@ class ExecutionEngine:
     Uses disk-streaming to avoid memory bloat on large datasets.
     """
 
-    def __init__(self, db_path: str = ":memory:"):
+    def __init__(
+        self, db_path: str = ":memory:", exceptions_dir: str = "data/exceptions"
+    ):
         logger.info(f"Initializing ExecutionEngine with db_path={db_path}")
+        # Exception rows are spilled here as Parquet instead of being
+        # materialized in memory - reports carry a path plus a small sample
+        self.exceptions_dir = Path(exceptions_dir)
+        self.exceptions_dir.mkdir(parents=True, exist_ok=True)
         self.conn = duckdb.connect(db_path)
-        # Enable Parquet extensions
-        logger.debug("Installing and loading Parquet extension")
-        self.conn.execute("INSTALL parquet")
-        self.conn.execute("LOAD parquet")
+        # Parquet support is compiled into DuckDB (and auto-loads on first
+        # use for any build where it isn't) - the old INSTALL/LOAD pair hit
+        # the extension registry on every engine construction for nothing,
+        # and failed outright on hosts without registry access
+        # Tune the connection for repeated parquet scans:
+        # - threads: use every core for scan/join parallelism
+        # - object_cache: keeps parquet footer/row-group metadata cached, so
+        #   the population-count query doesn't re-parse the same footers the
+        #   main query just read
+        # - preserve_insertion_order=false: results need no stable order
+        #   (exception samples are arbitrary rows), which unlocks fully
+        #   parallel out-of-order streaming
+        # memory_limit is left at DuckDB's default (80% of RAM) - a
+        # hardcoded cap would hurt on small hosts and do nothing on big ones
+        logger.debug("Applying DuckDB tuning PRAGMAs")
+        self.conn.execute(f"SET threads TO {os.cpu_count() or 1}")
+        self.conn.execute("SET enable_object_cache = true")
+        self.conn.execute("SET preserve_insertion_order = false")
+        # The shared connection is not safe for concurrent queries; callers
+        # running projects in parallel threads are serialized here. DuckDB
+        # already fans a single query out across all cores, so there is
+        # nothing to gain from overlapping queries anyway.
+        self._lock = threading.RLock()
         logger.info("ExecutionEngine initialized successfully")
 
     def execute_control(
@@ -44,29 +73,85 @@ class ExecutionEngine:
         Returns:
             Execution report with verdict, exceptions, and audit metadata
         """
+        with self._lock:
+            return self._execute_control(dsl, manifests)
+
+    def _execute_control(
+        self, dsl: EnterpriseControlDSL, manifests: Dict[str, Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """execute_control body, run under the connection lock"""
         logger.info(f"Executing control: {dsl.governance.control_id}")
         logger.debug(f"Manifests: {list(manifests.keys())}")
 
-        # Compile DSL to SQL
+        # One timestamp per execution, captured up front: every return path
+        # reuses it instead of re-formatting datetime.now(), and UTC removes
+        # the ambiguity of naive local time in the audit trail (the ledger's
+        # retention queries compare against SQLite's UTC 'now')
+        executed_at = datetime.now(timezone.utc).isoformat(timespec="milliseconds")
+
+        # Compile DSL to SQL with bound parameters: DuckDB binds the native
+        # Python values directly (no literal escaping) and can reuse the
+        # prepared plan when the same control runs repeatedly.
         logger.debug("Compiling DSL to SQL")
-        compiler = ControlCompiler(dsl)
-        sql = compiler.compile_to_sql(manifests)
-        logger.debug(f"SQL compilation complete, query length: {len(sql)} chars")
+        compiler = ControlCompiler(dsl, parameterize=True)
+        sql = compiler.compile_to_sql_with_population(manifests)
+        logger.debug(
+            f"SQL compilation complete, query length: {len(sql)} chars, "
+            f"{len(compiler.params)} bound parameter(s)"
+        )
 
         try:
-            # Execute query (DuckDB streams from disk - no RAM bloat)
-            logger.debug("Executing SQL query via DuckDB")
-            result = self.conn.execute(sql).df()
-            exception_count = len(result)
+            # Stream the exception rows straight to a Parquet spill file via
+            # COPY - nothing is materialized in Python, so peak memory stays
+            # O(sample) no matter how many exceptions the control finds. The
+            # report carries the file path; only the 100-row sample is ever
+            # converted to Python objects.
+            safe_id = "".join(
+                c if c.isalnum() or c in "-_" else "_"
+                for c in dsl.governance.control_id
+            )
+            stamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S_%f")
+            exceptions_path = str(
+                self.exceptions_dir / f"exceptions_{safe_id}_{stamp}.parquet"
+            )
+            logger.debug("Executing SQL query via DuckDB COPY")
+            exception_count = self.conn.execute(
+                f"COPY ({sql}) TO '{exceptions_path}' (FORMAT PARQUET)",
+                compiler.params,
+            ).fetchone()[0]
             logger.info(
                 f"Query executed successfully, {exception_count} exceptions found"
             )
 
-            # Calculate population size
-            logger.debug("Calculating population count")
-            total_population = self._get_population_count(manifests, dsl, compiler)
+            # Calculate population size. When the fused query returned
+            # exception rows, the population count rides along in the
+            # __pop_total window column - no second scan needed. With zero
+            # exceptions (or an aggregation/sampled query without the
+            # column), fall back to the separate count query.
+            spill_columns = pq.ParquetFile(exceptions_path).schema_arrow.names
+            has_pop_total = "__pop_total" in spill_columns
+            if has_pop_total and exception_count > 0:
+                total_population = int(
+                    self.conn.execute(
+                        f"SELECT __pop_total FROM read_parquet('{exceptions_path}') LIMIT 1"
+                    ).fetchone()[0]
+                )
+            else:
+                logger.debug("Calculating population count")
+                total_population = self._get_population_count(
+                    manifests, dsl, compiler
+                )
             logger.info(f"Total population: {total_population}")
 
+            sample_select = "* EXCLUDE (__pop_total)" if has_pop_total else "*"
+            exceptions_sample = (
+                self.conn.execute(
+                    f"SELECT {sample_select} FROM read_parquet('{exceptions_path}') LIMIT 100"
+                )
+                .fetch_arrow_table()
+                .to_pylist()
+            )
+
             # CRITICAL SAFEGUARD: Detect empty data feeds
             if total_population == 0:
                 logger.error(
@@ -79,10 +164,11 @@ class ExecutionEngine:
                     "exception_count": 0,
                     "total_population": 0,
                     "execution_query": sql,
+                    "execution_params": compiler.params,
                     "evidence_hashes": {
                         alias: meta["sha256_hash"] for alias, meta in manifests.items()
                     },
-                    "executed_at": datetime.now().isoformat(),
+                    "executed_at": executed_at,
                 }
 
             # Calculate exception rate
@@ -112,11 +198,13 @@ class ExecutionEngine:
                 "exception_rate_percent": round(exception_rate, 2),
                 "materiality_threshold_percent": max_threshold,
                 "execution_query": sql,
+                "execution_params": compiler.params,
                 "evidence_hashes": {
                     alias: meta["sha256_hash"] for alias, meta in manifests.items()
                 },
-                "exceptions_sample": result.head(100).to_dict(orient="records"),
-                "executed_at": datetime.now().isoformat(),
+                "exceptions_path": exceptions_path,
+                "exceptions_sample": exceptions_sample,
+                "executed_at": executed_at,
             }
 
         except Exception as e:
@@ -131,7 +219,8 @@ class ExecutionEngine:
                 "error_message": str(e),
                 "error_type": type(e).__name__,
                 "execution_query": sql,
-                "executed_at": datetime.now().isoformat(),
+                "execution_params": compiler.params,
+                "executed_at": executed_at,
             }
 
     def _get_population_count(
@@ -151,32 +240,44 @@ class ExecutionEngine:
         """
         logger.debug(f"Getting population count for {dsl.governance.control_id}")
 
+        # With no pipeline steps the population is simply every base-dataset
+        # row, which the ingestion manifest already knows - and failing that,
+        # the Parquet footer holds num_rows in a few KB of metadata. Either
+        # way, no SQL round-trip at all.
+        if not dsl.population.steps:
+            base_manifest = manifests[dsl.population.base_dataset]
+            try:
+                count = base_manifest.get("row_count")
+                if count is None:
+                    count = pq.ParquetFile(
+                        base_manifest["parquet_path"]
+                    ).metadata.num_rows
+                logger.debug(f"Population count from metadata: {count}")
+                return count
+            except Exception as e:
+                logger.debug(
+                    f"Metadata count unavailable ({type(e).__name__}: {e}), "
+                    f"falling back to count query"
+                )
+
         try:
-            # CRITICAL FIX: Create a fresh compiler instance to avoid CTE name collisions
-            # The compiler passed in will be used for the main query, so we can't modify its state
-            from src.compiler.sql_compiler import ControlCompiler
-
-            count_compiler = ControlCompiler(dsl)
-
-            # Build the CTE chain with this fresh compiler
-            final_cte_alias = count_compiler._build_population_cte(manifests)
-
-            # Build WHERE clause from population filters
-            if count_compiler.population_filters:
-                where_clause = " AND ".join(count_compiler.population_filters)
-                count_sql = f"""
-WITH {", ".join(count_compiler.cte_fragments)}
-SELECT COUNT(*) FROM {final_cte_alias}
-WHERE {where_clause}
-"""
+            # Reuse the CTE chain the main compile already built - same
+            # population semantics, no second compile. Only when the main
+            # compile was a template-cache hit (no built state to reuse) do
+            # we fall back to a fresh compiler, whose count query is itself
+            # served from the template cache on repeat runs.
+            count_params: list = []
+            derived = compiler.derive_population_count_sql()
+            if derived is not None:
+                count_sql, count_params = derived
             else:
-                count_sql = f"""
-WITH {", ".join(count_compiler.cte_fragments)}
-SELECT COUNT(*) FROM {final_cte_alias}
-"""
+                from src.compiler.sql_compiler import ControlCompiler
+
+                count_compiler = ControlCompiler(dsl)
+                count_sql = count_compiler.compile_population_count_sql(manifests)
 
             logger.debug(f"Population count SQL: {count_sql}")
-            result = self.conn.execute(count_sql).fetchone()
+            result = self.conn.execute(count_sql, count_params).fetchone()
             count = result[0] if result is not None else 0
             logger.debug(f"Population count: {count}")
             return count
@@ -220,7 +321,8 @@ SELECT COUNT(*) FROM {final_cte_alias}
         try:
             # EXPLAIN triggers Parser (syntax) and Binder (schema) validation
             # without executing the query over data
-            self.conn.execute(f"EXPLAIN {sql}")
+            with self._lock:
+                self.conn.execute(f"EXPLAIN {sql}")
             logger.info("SQL dry-run validation PASSED")
             return True, "Valid"
 
@@ -250,16 +352,19 @@ SELECT COUNT(*) FROM {final_cte_alias}
         Returns validation result with missing columns if any.
         """
         logger.debug(f"Validating schema for control {dsl.governance.control_id}")
-        expected_columns = {
+        # Hashed once up front; set.difference then accepts the manifest's
+        # column list directly, so the valid path allocates nothing per
+        # dataset beyond the (empty) difference result
+        expected_columns = frozenset(
             binding.technical_field for binding in dsl.ontology_bindings
-        }
+        )
         logger.debug(f"Expected columns: {expected_columns}")
 
         validation_results = []
 
         for dataset_alias, manifest in manifests.items():
-            actual_columns = set(manifest.get("columns", []))
-            missing = expected_columns - actual_columns
+            actual_columns = manifest.get("columns", [])
+            missing = expected_columns.difference(actual_columns)
 
             if missing:
                 logger.warning(
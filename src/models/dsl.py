@@ -4,9 +4,10 @@ Pydantic v2 models with discriminated unions for type safety
 """
 
 from datetime import datetime
+from functools import cached_property
 from typing import Annotated, List, Literal, Optional, Union
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 
 # ==========================================
 # DOMAIN 1: GOVERNANCE & ONTOLOGY
@@ -16,7 +17,7 @@ from pydantic import BaseModel, ConfigDict, Field
 class ControlGovernance(BaseModel):
     """Metadata linking control to regulatory frameworks and ownership"""
 
-    model_config = ConfigDict(extra="forbid", validate_assignment=True)
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
     control_id: str
     version: str
@@ -243,10 +244,50 @@ class EnterpriseControlDSL(BaseModel):
     Once approved, this JSON becomes immutable and versioned.
     """
 
-    model_config = ConfigDict(extra="forbid", validate_assignment=True)
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
     governance: ControlGovernance
     ontology_bindings: List[SemanticMapping]
     population: PopulationPipeline
     assertions: List[Assertion]  # Discriminator is now part of Assertion type
     evidence: EvidenceRequirements
+
+    # An instance is frozen, so its own serializations cannot go stale;
+    # computing them once spares hot paths (fingerprinting, audit persistence,
+    # prompt assembly) a full tree walk per reference. Copies are the one
+    # hazard: model_copy clones __dict__ including cached_property values,
+    # so an updated copy would carry the ORIGINAL's serialization. model_copy
+    # is overridden below to evict the cached entries from the copy.
+
+    @cached_property
+    def model_json(self) -> bytes:
+        """UTF-8 JSON of this control, serialized once and cached"""
+        return self.__pydantic_serializer__.to_json(self)
+
+    @cached_property
+    def model_dict(self) -> dict:
+        """Plain-dict dump of this control, built once and cached.
+
+        Shared across callers - treat as read-only.
+        """
+        return self.model_dump()
+
+    def model_copy(self, **kwargs) -> "EnterpriseControlDSL":
+        """model_copy that drops inherited serialization caches from the copy"""
+        copied = super().model_copy(**kwargs)
+        copied.__dict__.pop("model_json", None)
+        copied.__dict__.pop("model_dict", None)
+        return copied
+
+
+# ==========================================
+# PRECOMPILED VALIDATORS
+# ==========================================
+
+# Built once at import so the discriminated-union core schemas are reused
+# across parses instead of being re-resolved per call. validate_json goes
+# straight through pydantic-core's Rust parser, skipping the json -> dict
+# -> model two-step.
+ASSERTION_ADAPTER = TypeAdapter(Assertion)
+PIPELINE_ACTION_ADAPTER = TypeAdapter(PipelineAction)
+DSL_ADAPTER = TypeAdapter(EnterpriseControlDSL)
@@ -4,6 +4,9 @@ Coordinates all single-responsibility orchestration modules
 """
 
 import os
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Any, Dict, List
 
@@ -29,6 +32,27 @@ load_dotenv()
 logger = get_logger(__name__)
 
 
+class _LazyAITranslator:
+    """
+    Defers AITranslator construction - the instructor/openai imports and
+    HTTP client setup - until something actually calls it. A batch where
+    every DSL comes from the ledger cache never pays that cost.
+    """
+
+    def __init__(self, factory):
+        self._factory = factory
+        self._instance = None
+        self._lock = threading.Lock()
+
+    def __getattr__(self, name):
+        if self._instance is None:
+            with self._lock:
+                if self._instance is None:
+                    logger.debug("Materializing AITranslator on first use")
+                    self._instance = self._factory()
+        return getattr(self._instance, name)
+
+
 class BatchOrchestrator:
     """
     Orchestrates end-to-end control testing for multiple projects.
@@ -92,8 +116,10 @@ class BatchOrchestrator:
                 raise ValueError(
                     "DEEPSEEK_API_KEY not found. Set in .env or use use_mock_ai=True"
                 )
-            logger.info("Initializing AITranslator with DeepSeek API")
-            self.ai = AITranslator(api_key=api_key)
+            # Misconfiguration still fails at startup (the key check above),
+            # but the translator itself materializes on first use
+            logger.info("Deferring AITranslator construction until first use")
+            self.ai = _LazyAITranslator(lambda: AITranslator(api_key=api_key))
 
             if enable_llm_validation:
                 logger.info("Initializing AIValidator for DSL/SQL validation")
@@ -147,20 +173,62 @@ class BatchOrchestrator:
         # Print header
         self._print_batch_header(len(project_folders))
 
-        # Process each project
-        results = []
+        # One bulk ledger read warms the DSL memo for the whole batch -
+        # a single SELECT ... IN (...) instead of a get_control round trip
+        # per project. Unreadable projects are skipped here; the worker
+        # surfaces their error through the normal pipeline.
+        control_texts: Dict[str, str] = {}
         for project_path in project_folders:
-            project_name = project_path.name
-            logger.info(f"Starting processing for project: {project_name}")
-            self._print_project_header(project_name)
+            try:
+                control_id, control_text = ProjectReader.read_control_info(
+                    project_path
+                )
+            except (FileNotFoundError, OSError):
+                continue
+            control_texts[control_id] = control_text
+        self.dsl_manager.prefetch_controls(control_texts)
+
+        # Process each project. Projects are fully independent and most of
+        # a project's wall clock is I/O (the AI HTTP call, Excel reads,
+        # Parquet writes), so several are run concurrently on threads; the
+        # audit ledger and DuckDB engine serialize internally. A single
+        # project keeps the plain sequential path with ordered step output.
+        max_workers = min(8, len(project_folders))
+        if max_workers == 1:
+            results = []
+            for project_path in project_folders:
+                project_name = project_path.name
+                logger.info(f"Starting processing for project: {project_name}")
+                self._print_project_header(project_name)
+
+                result = self._process_single_project(project_path)
+                results.append(result)
 
-            result = self._process_single_project(project_path)
-            results.append(result)
+                logger.info(
+                    f"Project {project_name} completed with verdict: {result['verdict']}"
+                )
+                ResultFormatter.print_project_result(result)
+        else:
+            logger.info(f"Processing projects in parallel with {max_workers} workers")
+            results_by_name: Dict[str, Dict[str, Any]] = {}
+            with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                futures = {
+                    pool.submit(self._process_single_project, p): p.name
+                    for p in project_folders
+                }
+                for future in as_completed(futures):
+                    project_name = futures[future]
+                    result = future.result()
+                    results_by_name[project_name] = result
+                    logger.info(
+                        f"Project {project_name} completed with verdict: {result['verdict']}"
+                    )
 
-            logger.info(
-                f"Project {project_name} completed with verdict: {result['verdict']}"
-            )
-            ResultFormatter.print_project_result(result)
+            # Report in discovery order regardless of completion order
+            results = [results_by_name[p.name] for p in project_folders]
+            for result in results:
+                self._print_project_header(result["project_name"])
+                ResultFormatter.print_project_result(result)
 
         # Generate and print summary
         summary = ResultFormatter.generate_summary(results)
@@ -173,14 +241,31 @@ class BatchOrchestrator:
         Processes a single project through the full pipeline.
         Now significantly simplified by delegating to specialized modules.
 
+        Step output is buffered and written to stdout in one flush when the
+        project finishes - a single write syscall per project instead of
+        dozens, and parallel workers' output stays contiguous per project
+        instead of interleaving line by line.
+
         Returns:
             Execution result dictionary
         """
+        ui: List[str] = []
+        try:
+            return self._run_project_pipeline(project_path, ui)
+        finally:
+            if ui:
+                sys.stdout.write("\n".join(ui) + "\n")
+                sys.stdout.flush()
+
+    def _run_project_pipeline(
+        self, project_path: Path, ui: List[str]
+    ) -> Dict[str, Any]:
+        """_process_single_project body; appends step output to ui"""
         project_name = project_path.name
 
         try:
             # Step 1: Read project metadata
-            print("\n[1/5] 📄 Reading control-information.md...")
+            ui.append("\n[1/5] 📄 Reading control-information.md...")
             project_info = ProjectReader.read_project(project_path)
 
             if project_info is None:
@@ -192,17 +277,17 @@ class BatchOrchestrator:
                     reason="No Excel evidence files found",
                 )
 
-            print(f"   Control ID: {project_info.control_id}")
+            ui.append(f"   Control ID: {project_info.control_id}")
 
             # Step 2: Scan Excel files (already done by ProjectReader)
-            print("\n[2/5] 📊 Scanning for Excel evidence files...")
-            print(
+            ui.append("\n[2/5] 📊 Scanning for Excel evidence files...")
+            ui.append(
                 f"   Found {len(project_info.excel_files)} file(s): "
                 f"{', '.join(f.name for f in project_info.excel_files)}"
             )
 
             # Step 3: Get or generate DSL
-            print("\n[3/5] 🧠 Checking for existing DSL in audit database...")
+            ui.append("\n[3/5] 🧠 Checking for existing DSL in audit database...")
             dsl_result = self.dsl_manager.get_or_generate_dsl(
                 control_id=project_info.control_id,
                 control_text=project_info.control_text,
@@ -211,23 +296,25 @@ class BatchOrchestrator:
             )
 
             if dsl_result.was_cached:
-                print(
+                ui.append(
                     f"   ✓ DSL found (version {dsl_result.dsl.governance.version}) - reusing cached version"
                 )
             else:
-                print(
+                ui.append(
                     f"   ✓ DSL generated and saved (version {dsl_result.dsl.governance.version})"
                 )
 
             # Step 4: Ingest evidence
-            print(
+            ui.append(
                 "\n[4/5] 🔄 Ingesting Excel files to Parquet with cryptographic hashing..."
             )
-            manifests = self._ingest_evidence(project_info.excel_files, project_name)
+            manifests = self._ingest_evidence(
+                project_info.excel_files, project_name, ui
+            )
 
             # Step 5: Optional LLM validation
             if self.validation_orchestrator.enabled:
-                print("\n[5/7] 🔍 LLM Pre-Flight Validation (DSL & SQL Review)...")
+                ui.append("\n[5/7] 🔍 LLM Pre-Flight Validation (DSL & SQL Review)...")
                 # Compile SQL for validation
                 sql, _, _ = self.execution_orchestrator.compile_and_validate(
                     dsl_result.dsl, manifests
@@ -236,26 +323,26 @@ class BatchOrchestrator:
                     project_info.control_text, dsl_result.dsl, sql, manifests
                 )
                 if validation_result:
-                    self._print_validation_result(validation_result)
+                    self._append_validation_result(ui, validation_result)
 
             # Step 6: SQL validation & self-healing
             step_num = "6/7" if self.validation_orchestrator.enabled else "5/6"
-            print(f"\n[{step_num}] ✅ DuckDB EXPLAIN Validation (Strict Judge)...")
+            ui.append(f"\n[{step_num}] ✅ DuckDB EXPLAIN Validation (Strict Judge)...")
 
             sql, is_valid, error_msg = self.execution_orchestrator.compile_and_validate(
                 dsl_result.dsl, manifests
             )
 
             if not is_valid:
-                print(f"   ⚠️  SQL validation failed: {error_msg[:100]}...")
-                print("   🔧 Triggering AI Self-Healing protocol...")
+                ui.append(f"   ⚠️  SQL validation failed: {error_msg[:100]}...")
+                ui.append("   🔧 Triggering AI Self-Healing protocol...")
 
                 healing_result = self.self_healing_orchestrator.attempt_healing(
                     dsl_result.dsl, error_msg, dsl_result.headers, manifests
                 )
 
                 if not healing_result:
-                    print("   ❌ Self-healing failed. SQL still invalid.")
+                    ui.append("   ❌ Self-healing failed. SQL still invalid.")
                     return ResultFormatter.format_project_result(
                         project_name=project_name,
                         control_id=project_info.control_id,
@@ -263,21 +350,21 @@ class BatchOrchestrator:
                         error=f"Self-healing failed. Persistent SQL Error: {error_msg[:200]}",
                     )
 
-                print("   ✓ Second validation PASSED - SQL is now correct")
+                ui.append("   ✓ Second validation PASSED - SQL is now correct")
                 # Update DSL with healed version
                 dsl_result.dsl = healing_result.healed_dsl
             else:
-                print("   ✓ SQL validation PASSED - query is correct")
+                ui.append("   ✓ SQL validation PASSED - query is correct")
 
             # Step 7: Execute control test
             step_num = "7/7" if self.validation_orchestrator.enabled else "6/6"
-            print(f"\n[{step_num}] ⚙️  Executing control via DuckDB SQL engine...")
+            ui.append(f"\n[{step_num}] ⚙️  Executing control via DuckDB SQL engine...")
 
             report = self.execution_orchestrator.execute(dsl_result.dsl, manifests)
 
             # Save execution to audit ledger
             self.audit.save_execution(report)
-            print("   ✓ Execution complete - results saved to audit database")
+            ui.append("   ✓ Execution complete - results saved to audit database")
 
             return ResultFormatter.format_project_result(
                 project_name=project_name,
@@ -294,7 +381,7 @@ class BatchOrchestrator:
                 f"Critical error processing project {project_name}: {type(e).__name__}: {str(e)}",
                 exc_info=True,
             )
-            print(f"\n❌ CRITICAL ERROR: {type(e).__name__}: {str(e)}")
+            ui.append(f"\n❌ CRITICAL ERROR: {type(e).__name__}: {str(e)}")
             return ResultFormatter.format_project_result(
                 project_name=project_name,
                 control_id=getattr(
@@ -305,7 +392,7 @@ class BatchOrchestrator:
             )
 
     def _ingest_evidence(
-        self, excel_files: List[Path], project_name: str
+        self, excel_files: List[Path], project_name: str, ui: List[str]
     ) -> Dict[str, Dict[str, Any]]:
         """
         Ingests Excel files to Parquet with cryptographic hashing.
@@ -313,35 +400,48 @@ class BatchOrchestrator:
         Args:
             excel_files: List of Excel file paths
             project_name: Project name for source tracking
+            ui: Buffer collecting the project's step output
 
         Returns:
             Dictionary mapping dataset_alias to manifest
         """
         manifests = {}
 
-        for excel in excel_files:
+        def _ingest_one(excel: Path) -> List[Dict[str, Any]]:
             dataset_prefix = excel.stem.lower()
             logger.debug(f"Processing evidence file: {excel.name}")
-            print(f"   Processing: {excel.name}...")
-
-            manifest_list = self.ingestion.ingest_excel_to_parquet(
+            ui.append(f"   Processing: {excel.name}...")
+            return self.ingestion.ingest_excel_to_parquet(
                 str(excel), dataset_prefix, source_system=f"PROJECT_{project_name}"
             )
 
+        # Files are ingested concurrently; multi-sheet workbooks already
+        # fan their sheets out to a process pool inside ingestion, so the
+        # threads here mostly overlap ZIP/XML reads and Parquet writes
+        if len(excel_files) > 1:
+            workers = min(os.cpu_count() or 1, len(excel_files))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                manifest_lists = list(pool.map(_ingest_one, excel_files))
+        else:
+            manifest_lists = [_ingest_one(excel) for excel in excel_files]
+
+        for manifest_list in manifest_lists:
             for manifest in manifest_list:
                 manifests[manifest["dataset_alias"]] = manifest
-                # Save manifest to audit ledger
-                self.audit.save_evidence_manifest(manifest)
                 logger.info(
                     f"Ingested {manifest['dataset_alias']}: {manifest['row_count']} rows, "
                     f"hash: {manifest['sha256_hash'][:16]}..."
                 )
-                print(
+                ui.append(
                     f"      ✓ {manifest['dataset_alias']}: "
                     f"{manifest['row_count']} rows, "
                     f"hash: {manifest['sha256_hash'][:12]}..."
                 )
 
+        # One batched ledger write for every sheet of every file - a single
+        # transaction/fsync instead of one per manifest
+        self.audit.save_evidence_manifests(list(manifests.values()))
+
         return manifests
 
     @staticmethod
@@ -360,31 +460,31 @@ class BatchOrchestrator:
         print(f"{'─' * 60}")
 
     @staticmethod
-    def _print_validation_result(validation_result):
-        """Prints LLM validation results"""
-        print(
+    def _append_validation_result(ui: List[str], validation_result):
+        """Appends LLM validation results to the project's output buffer"""
+        ui.append(
             f"   DSL Validation: {'✓ PASS' if validation_result.dsl_report.is_valid else '⚠️ ISSUES FOUND'}"
         )
-        print(
+        ui.append(
             f"   SQL Validation: {'✓ PASS' if validation_result.sql_report.is_valid else '⚠️ ISSUES FOUND'}"
         )
 
         if validation_result.critical_issues:
-            print(
+            ui.append(
                 f"\n   ⚠️  {len(validation_result.critical_issues)} CRITICAL issue(s) detected:"
             )
             for idx, issue in enumerate(validation_result.critical_issues[:3], 1):
-                print(f"      {idx}. [{issue.category}] {issue.message[:80]}...")
+                ui.append(f"      {idx}. [{issue.category}] {issue.message[:80]}...")
                 if issue.suggested_fix:
-                    print(f"         Fix: {issue.suggested_fix[:80]}...")
+                    ui.append(f"         Fix: {issue.suggested_fix[:80]}...")
 
             if len(validation_result.critical_issues) > 3:
-                print(
+                ui.append(
                     f"      ... and {len(validation_result.critical_issues) - 3} more issues"
                 )
-            print("   ⚠️  Proceeding to DuckDB validation (strict judge will decide)")
+            ui.append("   ⚠️  Proceeding to DuckDB validation (strict judge will decide)")
         else:
-            print("   ✓ No critical issues detected by LLM")
+            ui.append("   ✓ No critical issues detected by LLM")
 
     def close(self):
         """Cleanup resources"""
@@ -3,11 +3,14 @@ DSL Manager Module
 Single Responsibility: Manage DSL retrieval, generation, and caching
 """
 
-from typing import TYPE_CHECKING, Dict, List, Optional, Union
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Union
 
 from src.ai.translator import AITranslator
 from src.execution.ingestion import EvidenceIngestion
-from src.models.dsl import EnterpriseControlDSL
+from src.models.dsl import DSL_ADAPTER, EnterpriseControlDSL
 from src.storage.audit_fabric import AuditFabric
 from src.utils.logging_config import get_logger
 
@@ -49,8 +52,47 @@ class DSLManager:
         """
         self.ai = ai_translator
         self.audit = audit
+        # In-process memo across the batch, keyed by (control_id, hash of
+        # the control text): parallel projects sharing a control skip both
+        # the ledger round-trip and any repeat LLM call
+        self._dsl_cache: Dict[Tuple[str, str], EnterpriseControlDSL] = {}
+        self._cache_lock = threading.Lock()
         logger.debug("DSLManager initialized")
 
+    def prefetch_controls(self, control_texts: Dict[str, str]) -> None:
+        """
+        Warms the batch memo with one bulk ledger query.
+
+        Args:
+            control_texts: Mapping of control_id to control procedure text
+
+        Stored DSLs whose recorded text hash no longer matches the current
+        procedure text are skipped - the normal path regenerates them.
+        Rows saved before hashes were recorded are accepted, matching
+        get_control's staleness semantics.
+        """
+        stored = self.audit.get_controls_bulk(list(control_texts))
+        if not stored:
+            return
+
+        warmed = 0
+        for control_id, (dsl_json, stored_hash) in stored.items():
+            text_hash = hashlib.sha256(
+                control_texts[control_id].encode()
+            ).hexdigest()[:16]
+            if stored_hash and stored_hash != text_hash:
+                continue
+            try:
+                dsl = DSL_ADAPTER.validate_json(dsl_json)
+            except Exception as e:
+                logger.warning(f"Skipping unparseable stored DSL {control_id}: {e}")
+                continue
+            with self._cache_lock:
+                self._dsl_cache[(control_id, text_hash)] = dsl
+            warmed += 1
+
+        logger.info(f"Prefetched {warmed} cached DSL(s) in one ledger query")
+
     def get_or_generate_dsl(
         self,
         control_id: str,
@@ -75,14 +117,29 @@ class DSLManager:
         """
         logger.debug(f"Checking for cached DSL: {control_id}")
 
-        # Try to retrieve from cache
-        dsl_dict = self.audit.get_control(control_id)
+        # The cache key includes the control text, so an edited procedure
+        # never reuses a DSL generated from the old wording
+        text_hash = hashlib.sha256(control_text.encode()).hexdigest()[:16]
+        cache_key = (control_id, text_hash)
+
+        with self._cache_lock:
+            cached_dsl = self._dsl_cache.get(cache_key)
+        if cached_dsl is not None:
+            logger.info(f"DSL found in batch memo for {control_id}")
+            headers = self._extract_headers(excel_files, ingestion)
+            return DSLResult(dsl=cached_dsl, was_cached=True, headers=headers)
 
-        if dsl_dict:
+        # Try to retrieve from the audit ledger; the raw JSON goes straight
+        # through pydantic-core's Rust parser, no intermediate dict
+        dsl_json = self.audit.get_control_json(control_id, text_hash=text_hash)
+
+        if dsl_json:
+            dsl = DSL_ADAPTER.validate_json(dsl_json)
             logger.info(
-                f"DSL found in cache for {control_id}, version {dsl_dict['governance']['version']}"
+                f"DSL found in cache for {control_id}, version {dsl.governance.version}"
             )
-            dsl = EnterpriseControlDSL(**dsl_dict)
+            with self._cache_lock:
+                self._dsl_cache[cache_key] = dsl
 
             # Extract headers for potential self-healing
             headers = self._extract_headers(excel_files, ingestion)
@@ -103,12 +160,24 @@ class DSLManager:
         logger.info(f"Calling AI translator for control {control_id}")
         dsl = self.ai.translate_control(control_text, headers)
 
-        # Override control_id if AI hallucinated
-        dsl.governance.control_id = control_id
+        # Override control_id if AI hallucinated; the models are frozen,
+        # so build an updated copy instead of assigning in place
+        if dsl.governance.control_id != control_id:
+            dsl = dsl.model_copy(
+                update={
+                    "governance": dsl.governance.model_copy(
+                        update={"control_id": control_id}
+                    )
+                }
+            )
 
         # Save to cache
         logger.debug(f"Saving generated DSL to audit database for {control_id}")
-        self.audit.save_control(dsl.model_dump(), approved_by="AUTO_GENERATED_SYSTEM")
+        self.audit.save_control(
+            dsl, approved_by="AUTO_GENERATED_SYSTEM", text_hash=text_hash
+        )
+        with self._cache_lock:
+            self._dsl_cache[cache_key] = dsl
 
         logger.info(
             f"DSL generated and saved for {control_id}, version {dsl.governance.version}"
@@ -132,14 +201,27 @@ class DSLManager:
         """
         headers = {}
 
-        for excel in excel_files:
+        def _headers_for(excel):
             try:
-                sheet_headers = ingestion.get_column_headers(str(excel))
-                for sheet_name, cols in sheet_headers.items():
-                    dataset_alias = f"{excel.stem}_{sheet_name}".lower()
-                    headers[dataset_alias] = cols
-                    logger.debug(f"Extracted {len(cols)} columns from {dataset_alias}")
+                return excel, ingestion.get_column_headers(str(excel))
             except Exception as e:
                 logger.warning(f"Failed to extract headers from {excel.name}: {e}")
+                return excel, None
+
+        # Header extraction is I/O-bound (ZIP + XML streaming), so several
+        # workbooks are scanned on threads; a single file skips the pool
+        if len(excel_files) > 1:
+            with ThreadPoolExecutor(max_workers=min(8, len(excel_files))) as pool:
+                results = list(pool.map(_headers_for, excel_files))
+        else:
+            results = [_headers_for(excel) for excel in excel_files]
+
+        for excel, sheet_headers in results:
+            if sheet_headers is None:
+                continue
+            for sheet_name, cols in sheet_headers.items():
+                dataset_alias = f"{excel.stem}_{sheet_name}".lower()
+                headers[dataset_alias] = cols
+                logger.debug(f"Extracted {len(cols)} columns from {dataset_alias}")
 
         return headers
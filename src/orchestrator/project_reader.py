@@ -3,14 +3,19 @@ Project Reader Module
 Single Responsibility: Read project metadata and discover evidence files
 """
 
+import os
 import re
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from src.utils.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Compiled once; _extract_control_id runs for every project in a batch
+_CTRL_ID_RE = re.compile(r"CTRL-[\w\-]+")
+_CTRL_ID_LABELED_RE = re.compile(r"Control ID:\s*([A-Z0-9\-]+)", re.IGNORECASE)
+
 
 class ProjectInfo:
     """Data class for project information"""
@@ -53,27 +58,21 @@ class ProjectReader:
         project_name = project_path.name
         logger.debug(f"Reading project: {project_name}")
 
-        # Step 1: Read control information
-        control_information_file = project_path / "control-information.md"
-        if not control_information_file.exists():
-            logger.error(f"control-information.md not found in {project_name}")
-            raise FileNotFoundError(
-                f"control-information.md not found in {project_name}"
-            )
-
-        with open(control_information_file, "r", encoding="utf-8") as f:
-            control_text = f.read()
-
-        # Step 2: Extract control ID
-        control_id = ProjectReader._extract_control_id(control_text, project_name)
+        # Steps 1-2: Read control information and extract the control ID
+        control_id, control_text = ProjectReader.read_control_info(project_path)
         logger.info(f"Extracted control ID: {control_id} from {project_name}")
 
-        # Step 3: Discover Excel files
-        excel_files = list(project_path.glob("*.xlsx")) + list(
-            project_path.glob("*.xls")
-        )
-        # Filter out temporary Excel files
-        excel_files = [f for f in excel_files if not f.name.startswith("~$")]
+        # Step 3: Discover Excel files. One os.scandir pass covers both
+        # extensions and skips ~$ temp files without the extra stat calls
+        # pathlib.glob would make per pattern.
+        with os.scandir(project_path) as entries:
+            excel_files = sorted(
+                Path(entry.path)
+                for entry in entries
+                if entry.is_file(follow_symlinks=False)
+                and entry.name.lower().endswith((".xlsx", ".xls"))
+                and not entry.name.startswith("~$")
+            )
 
         if not excel_files:
             logger.warning(f"No Excel files found in {project_name}")
@@ -91,6 +90,32 @@ class ProjectReader:
             excel_files=excel_files,
         )
 
+    @staticmethod
+    def read_control_info(project_path: Path) -> Tuple[str, str]:
+        """
+        Reads control-information.md and extracts the control ID.
+
+        Cheap enough to call ahead of the full project read (e.g. for
+        bulk-prefetching cached DSLs) - no Excel discovery is done.
+
+        Returns:
+            Tuple of (control_id, control_text)
+
+        Raises:
+            FileNotFoundError: If control-information.md is missing
+        """
+        project_name = project_path.name
+        control_information_file = project_path / "control-information.md"
+        if not control_information_file.exists():
+            logger.error(f"control-information.md not found in {project_name}")
+            raise FileNotFoundError(
+                f"control-information.md not found in {project_name}"
+            )
+
+        control_text = control_information_file.read_text(encoding="utf-8")
+        control_id = ProjectReader._extract_control_id(control_text, project_name)
+        return control_id, control_text
+
     @staticmethod
     def _extract_control_id(control_text: str, fallback_project_name: str) -> str:
         """
@@ -98,12 +123,12 @@ class ProjectReader:
         Looks for patterns like: "CTRL-908101" or "Control ID: XYZ-123"
         """
         # Pattern 1: "CTRL-XXXXXX"
-        match = re.search(r"CTRL-[\w\-]+", control_text)
+        match = _CTRL_ID_RE.search(control_text)
         if match:
             return match.group(0)
 
         # Pattern 2: "Control ID: XYZ-123"
-        match = re.search(r"Control ID:\s*([A-Z0-9\-]+)", control_text, re.IGNORECASE)
+        match = _CTRL_ID_LABELED_RE.search(control_text)
         if match:
             return match.group(1)
 
@@ -133,7 +158,8 @@ class ProjectReader:
             logger.error(f"Input directory not found: {input_dir}")
             raise FileNotFoundError(f"Input directory not found: {input_dir}")
 
-        project_folders = [f for f in base_path.iterdir() if f.is_dir()]
+        with os.scandir(base_path) as entries:
+            project_folders = [Path(entry.path) for entry in entries if entry.is_dir()]
         logger.info(f"Discovered {len(project_folders)} project folders in {input_dir}")
 
         return sorted(project_folders)
@@ -102,18 +102,25 @@ class ResultFormatter:
             Summary statistics dictionary
         """
         total = len(results)
-        pass_count = sum(1 for r in results if r["verdict"] == "PASS")
-        fail_count = sum(1 for r in results if r["verdict"] == "FAIL")
-        error_count = sum(1 for r in results if r["verdict"] == "ERROR")
-        skipped_count = sum(1 for r in results if r["verdict"] == "SKIPPED")
 
-        cached_dsl_count = sum(1 for r in results if r.get("dsl_cached", False))
+        # Single fused pass instead of one scan per counter
+        verdict_counts = {"PASS": 0, "FAIL": 0, "ERROR": 0, "SKIPPED": 0}
+        cached_dsl_count = 0
+        for r in results:
+            verdict = r["verdict"]
+            if verdict in verdict_counts:
+                verdict_counts[verdict] += 1
+            if r.get("dsl_cached", False):
+                cached_dsl_count += 1
+
+        error_count = verdict_counts["ERROR"]
+        skipped_count = verdict_counts["SKIPPED"]
         generated_dsl_count = total - cached_dsl_count - error_count - skipped_count
 
         return {
             "total_projects": total,
-            "pass_count": pass_count,
-            "fail_count": fail_count,
+            "pass_count": verdict_counts["PASS"],
+            "fail_count": verdict_counts["FAIL"],
             "error_count": error_count,
             "skipped_count": skipped_count,
             "cached_dsl_count": cached_dsl_count,
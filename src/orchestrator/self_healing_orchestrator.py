@@ -100,7 +100,7 @@ class SelfHealingOrchestrator:
 
             # Save healed DSL to audit database
             self.audit.save_control(
-                healed_dsl.model_dump(), approved_by="AI_SELF_HEALED_SYSTEM"
+                healed_dsl, approved_by="AI_SELF_HEALED_SYSTEM"
             )
 
             return HealingResult(
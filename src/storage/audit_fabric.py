@@ -5,12 +5,17 @@ Immutable storage for control DSLs, execution history, and evidence manifests
 
 import json
 import sqlite3
+import threading
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
 
 import pandas as pd
 
+if TYPE_CHECKING:
+    from src.models.dsl import EnterpriseControlDSL
+
 from src.utils.logging_config import get_logger
 
 # Get logger for this module
@@ -46,8 +51,27 @@ class AuditFabric:
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         logger.debug(f"Database path: {self.db_path.absolute()}")
-        self.conn = sqlite3.connect(str(self.db_path))
+        # check_same_thread=False lets parallel project workers share this
+        # connection; the reentrant lock serializes their statements so a
+        # writer never interleaves with another writer's implicit transaction
+        self.conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
         self.conn.row_factory = sqlite3.Row  # Return rows as dictionaries
+        self._lock = threading.RLock()
+        self._in_transaction = False
+        # WAL turns each commit into a log append instead of a full-database
+        # journal rewrite, and readers no longer block on writers - which
+        # the parallel project workers rely on. synchronous=NORMAL is safe
+        # in WAL mode (a crash can lose the last commit but never corrupts),
+        # busy_timeout retries instead of throwing SQLITE_BUSY, temp_store
+        # and the 64 MiB page cache keep index builds off the disk.
+        logger.debug("Applying SQLite tuning PRAGMAs")
+        self.conn.executescript(
+            "PRAGMA journal_mode=WAL;"
+            "PRAGMA synchronous=NORMAL;"
+            "PRAGMA busy_timeout=5000;"
+            "PRAGMA temp_store=MEMORY;"
+            "PRAGMA cache_size=-65536;"
+        )
         logger.debug("Initializing database schema")
         self._init_schema()
         logger.info("AuditFabric initialized successfully")
@@ -71,6 +95,11 @@ class AuditFabric:
             )
         """)
 
+        # Older databases predate the text_hash column - add it in place
+        control_columns = {row[1] for row in cursor.execute("PRAGMA table_info(controls)")}
+        if "text_hash" not in control_columns:
+            cursor.execute("ALTER TABLE controls ADD COLUMN text_hash TEXT")
+
         # Evidence manifests table
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS evidence_manifests (
@@ -108,9 +137,30 @@ class AuditFabric:
             )
         """)
 
+        # Older databases predate the hash_algo column - add it in place.
+        # The sha256_hash column name is legacy: with blake3 installed the
+        # digest it holds is blake3, and hash_algo records which algorithm
+        # actually produced it so re-verification uses the right one.
+        manifest_columns = {
+            row[1] for row in cursor.execute("PRAGMA table_info(evidence_manifests)")
+        }
+        if "hash_algo" not in manifest_columns:
+            cursor.execute(
+                "ALTER TABLE evidence_manifests ADD COLUMN hash_algo TEXT"
+            )
+
+        # Older databases predate the execution_params column - add it in
+        # place. Queries run parameterized, so the bound values must be
+        # stored alongside compiled_sql for the record to stay self-contained.
+        execution_columns = {
+            row[1] for row in cursor.execute("PRAGMA table_info(executions)")
+        }
+        if "execution_params" not in execution_columns:
+            cursor.execute("ALTER TABLE executions ADD COLUMN execution_params TEXT")
+
         # Create indexes
         cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_executions_control 
+            CREATE INDEX IF NOT EXISTS idx_executions_control
             ON executions(control_id)
         """)
 
@@ -126,59 +176,158 @@ class AuditFabric:
 
         self.conn.commit()
 
-    def save_control(self, dsl: Dict[str, Any], approved_by: str) -> None:
+    @contextmanager
+    def transaction(self):
+        """
+        Groups multiple writes into a single BEGIN IMMEDIATE ... COMMIT.
+
+        N saves inside the block pay one fsync instead of N. The ledger
+        lock is held for the duration so no other thread's write can be
+        swept into (or committed by) this transaction.
+        """
+        with self._lock:
+            self.conn.execute("BEGIN IMMEDIATE")
+            self._in_transaction = True
+            try:
+                yield
+            except Exception:
+                self.conn.rollback()
+                raise
+            else:
+                self.conn.commit()
+            finally:
+                self._in_transaction = False
+
+    def _commit(self):
+        """Commits unless an enclosing transaction() owns the commit"""
+        if not self._in_transaction:
+            self.conn.commit()
+
+    def save_control(
+        self,
+        dsl: Union["EnterpriseControlDSL", Dict[str, Any]],
+        approved_by: str,
+        text_hash: Optional[str] = None,
+    ) -> None:
         """
         Persists approved DSL to immutable store.
 
         Args:
-            dsl: The EnterpriseControlDSL as dictionary
+            dsl: The EnterpriseControlDSL model (serialized through
+                pydantic-core's cached Rust JSON path) or a plain dict
             approved_by: Username of approver
+            text_hash: Hash of the control procedure text the DSL was
+                generated from, used to detect stale cached DSLs
         """
-        control_id = dsl["governance"]["control_id"]
-        version = dsl["governance"]["version"]
+        if isinstance(dsl, dict):
+            governance = dsl["governance"]
+            dsl_json = json.dumps(dsl, indent=2)
+        else:
+            governance = dsl.model_dict["governance"]
+            dsl_json = dsl.model_json.decode()
+
+        control_id = governance["control_id"]
+        version = governance["version"]
         logger.info(f"Saving control DSL: {control_id} v{version}")
         logger.debug(f"Approved by: {approved_by}")
 
-        cursor = self.conn.cursor()
+        owner_role = governance["owner_role"]
 
-        owner_role = dsl["governance"]["owner_role"]
+        with self._lock:
+            cursor = self.conn.cursor()
+            cursor.execute(
+                """
+                INSERT OR REPLACE INTO controls
+                (control_id, dsl_json, version, owner_role, approved_by,
+                 approved_at, text_hash)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            """,
+                (
+                    control_id,
+                    dsl_json,
+                    version,
+                    owner_role,
+                    approved_by,
+                    datetime.now().isoformat(),
+                    text_hash,
+                ),
+            )
 
-        cursor.execute(
-            """
-            INSERT OR REPLACE INTO controls 
-            (control_id, dsl_json, version, owner_role, approved_by, approved_at)
-            VALUES (?, ?, ?, ?, ?, ?)
-        """,
-            (
-                control_id,
-                json.dumps(dsl, indent=2),
-                version,
-                owner_role,
-                approved_by,
-                datetime.now().isoformat(),
-            ),
-        )
+            self._commit()
 
-        self.conn.commit()
+    def get_control(
+        self, control_id: str, text_hash: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Retrieves approved DSL by control_id as a dict.
 
-    def get_control(self, control_id: str) -> Optional[Dict[str, Any]]:
-        """Retrieves approved DSL by control_id"""
+        When text_hash is given, a stored DSL generated from different
+        control text is treated as stale and not returned (rows saved
+        before hashes were recorded are still accepted).
+        """
+        raw = self.get_control_json(control_id, text_hash=text_hash)
+        return json.loads(raw) if raw is not None else None
+
+    def get_control_json(
+        self, control_id: str, text_hash: Optional[str] = None
+    ) -> Optional[str]:
+        """
+        Retrieves approved DSL by control_id as its raw JSON text.
+
+        Hot-path callers validate the string directly with pydantic-core's
+        Rust JSON parser, skipping the json -> dict -> model two-step.
+        Staleness semantics match get_control.
+        """
         logger.debug(f"Retrieving control DSL for {control_id}")
-        cursor = self.conn.cursor()
-        cursor.execute(
-            """
-            SELECT dsl_json FROM controls WHERE control_id = ?
-        """,
-            (control_id,),
-        )
+        with self._lock:
+            cursor = self.conn.cursor()
+            cursor.execute(
+                """
+                SELECT dsl_json, text_hash FROM controls WHERE control_id = ?
+            """,
+                (control_id,),
+            )
 
-        row = cursor.fetchone()
+            row = cursor.fetchone()
         if row:
+            stored_hash = row["text_hash"]
+            if text_hash and stored_hash and stored_hash != text_hash:
+                logger.info(
+                    f"Control {control_id} found but control text changed "
+                    f"(stored hash {stored_hash} != {text_hash}) - treating as stale"
+                )
+                return None
             logger.debug(f"Control {control_id} found in database")
-            return json.loads(row["dsl_json"])
+            return row["dsl_json"]
         logger.debug(f"Control {control_id} not found in database")
         return None
 
+    def get_controls_bulk(
+        self, control_ids: List[str]
+    ) -> Dict[str, "tuple[str, Optional[str]]"]:
+        """
+        Fetches several stored controls in one SELECT.
+
+        Returns a dict of control_id -> (dsl_json, text_hash) for the IDs
+        that exist; callers apply their own staleness checks. One round
+        trip for a whole batch instead of one per project.
+        """
+        if not control_ids:
+            return {}
+        logger.debug(f"Bulk-fetching {len(control_ids)} control(s)")
+        placeholders = ",".join("?" * len(control_ids))
+        with self._lock:
+            cursor = self.conn.cursor()
+            cursor.execute(
+                f"""
+                SELECT control_id, dsl_json, text_hash FROM controls
+                WHERE control_id IN ({placeholders})
+            """,
+                control_ids,
+            )
+            rows = cursor.fetchall()
+        return {row["control_id"]: (row["dsl_json"], row["text_hash"]) for row in rows}
+
     def save_evidence_manifest(self, manifest: Dict[str, Any]) -> int:
         """
         Saves evidence manifest with source metadata.
@@ -187,34 +336,73 @@ class AuditFabric:
             manifest_id
         """
         logger.debug(f"Saving evidence manifest for {manifest['dataset_alias']}")
-        cursor = self.conn.cursor()
+        with self._lock:
+            cursor = self.conn.cursor()
 
-        cursor.execute(
-            """
-            INSERT INTO evidence_manifests 
-            (dataset_alias, parquet_path, sha256_hash, row_count, column_count,
-             source_system, extraction_timestamp, schema_version, ingested_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """,
+            cursor.execute(
+                """
+                INSERT INTO evidence_manifests
+                (dataset_alias, parquet_path, sha256_hash, hash_algo, row_count,
+                 column_count, source_system, extraction_timestamp, schema_version,
+                 ingested_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+                (
+                    manifest["dataset_alias"],
+                    manifest["parquet_path"],
+                    manifest["sha256_hash"],
+                    manifest.get("hash_algo", "sha256"),
+                    manifest["row_count"],
+                    manifest["column_count"],
+                    manifest.get("source_system"),
+                    manifest.get("extraction_timestamp"),
+                    manifest.get("schema_version"),
+                    manifest["ingested_at"],
+                ),
+            )
+
+            self._commit()
+            manifest_id = cursor.lastrowid
+
+        if manifest_id is None:
+            raise RuntimeError("Failed to retrieve manifest_id after insert")
+        return manifest_id
+
+    def save_evidence_manifests(self, manifests: List[Dict[str, Any]]) -> None:
+        """
+        Saves a batch of evidence manifests in one statement and one
+        transaction - one fsync for the whole batch instead of one per
+        sheet.
+        """
+        if not manifests:
+            return
+        logger.debug(f"Saving {len(manifests)} evidence manifest(s) in one batch")
+        rows = [
             (
                 manifest["dataset_alias"],
                 manifest["parquet_path"],
                 manifest["sha256_hash"],
+                manifest.get("hash_algo", "sha256"),
                 manifest["row_count"],
                 manifest["column_count"],
                 manifest.get("source_system"),
                 manifest.get("extraction_timestamp"),
                 manifest.get("schema_version"),
                 manifest["ingested_at"],
-            ),
-        )
-
-        self.conn.commit()
-        manifest_id = cursor.lastrowid
-
-        if manifest_id is None:
-            raise RuntimeError("Failed to retrieve manifest_id after insert")
-        return manifest_id
+            )
+            for manifest in manifests
+        ]
+        with self.transaction():
+            self.conn.executemany(
+                """
+                INSERT INTO evidence_manifests
+                (dataset_alias, parquet_path, sha256_hash, hash_algo, row_count,
+                 column_count, source_system, extraction_timestamp, schema_version,
+                 ingested_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+                rows,
+            )
 
     def save_execution(self, report: Dict[str, Any]) -> None:
         """
@@ -232,35 +420,40 @@ class AuditFabric:
             f"Execution details: exceptions={report.get('exception_count', 0)}, population={report.get('total_population', 0)}"
         )
 
-        cursor = self.conn.cursor()
-
         execution_id = str(uuid.uuid4())
         logger.debug(f"Generated execution_id: {execution_id}")
 
-        cursor.execute(
-            """
-            INSERT INTO executions 
-            (execution_id, control_id, verdict, exception_count, total_population,
-             exception_rate_percent, compiled_sql, evidence_hashes, exceptions_sample,
-             error_message, executed_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """,
-            (
-                execution_id,
-                report["control_id"],
-                report["verdict"],
-                report.get("exception_count"),
-                report.get("total_population"),
-                report.get("exception_rate_percent"),
-                report["execution_query"],
-                json.dumps(report.get("evidence_hashes", {})),
-                json.dumps(_sanitize_for_json(report.get("exceptions_sample", []))),
-                report.get("error_message"),
-                report["executed_at"],
-            ),
-        )
+        with self._lock:
+            cursor = self.conn.cursor()
+            cursor.execute(
+                """
+                INSERT INTO executions
+                (execution_id, control_id, verdict, exception_count, total_population,
+                 exception_rate_percent, compiled_sql, execution_params,
+                 evidence_hashes, exceptions_sample, error_message, executed_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+                (
+                    execution_id,
+                    report["control_id"],
+                    report["verdict"],
+                    report.get("exception_count"),
+                    report.get("total_population"),
+                    report.get("exception_rate_percent"),
+                    report["execution_query"],
+                    json.dumps(
+                        _sanitize_for_json(report.get("execution_params", []))
+                    ),
+                    json.dumps(report.get("evidence_hashes", {})),
+                    json.dumps(
+                        _sanitize_for_json(report.get("exceptions_sample", []))
+                    ),
+                    report.get("error_message"),
+                    report["executed_at"],
+                ),
+            )
 
-        self.conn.commit()
+            self._commit()
 
     def get_execution_history(
         self, control_id: str, limit: int = 100
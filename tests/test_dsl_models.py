@@ -140,6 +140,58 @@ def test_complete_dsl_validation():
     assert dsl.assertions[0].assertion_type == "value_match"
 
 
+def test_model_copy_does_not_inherit_cached_serializations():
+    """
+    Test that model_copy evicts the cached model_json/model_dict.
+
+    Regression: model_copy clones __dict__ including cached_property
+    values, so an updated copy used to serialize as the ORIGINAL -
+    e.g. persisting a stale control_id after a hallucination override.
+    """
+    dsl_dict = {
+        "governance": {
+            "control_id": "TEST-001",
+            "version": "1.0.0",
+            "owner_role": "Test Owner",
+            "testing_frequency": "Daily",
+            "regulatory_citations": ["SOX 404"],
+            "risk_objective": "Test objective",
+        },
+        "ontology_bindings": [],
+        "population": {"base_dataset": "trades", "steps": []},
+        "assertions": [
+            {
+                "assertion_id": "assert_001",
+                "assertion_type": "value_match",
+                "description": "Status must be approved",
+                "field": "approval_status",
+                "operator": "eq",
+                "expected_value": "APPROVED",
+                "materiality_threshold_percent": 0.0,
+            }
+        ],
+        "evidence": {
+            "retention_years": 7,
+            "reviewer_workflow": "Requires_Human_Signoff",
+            "exception_routing_queue": "JIRA:COMPLIANCE",
+        },
+    }
+
+    dsl = EnterpriseControlDSL(**dsl_dict)
+    # Warm the caches before copying
+    assert b'"TEST-001"' in dsl.model_json
+    assert dsl.model_dict["governance"]["control_id"] == "TEST-001"
+
+    updated = dsl.model_copy(
+        update={"governance": dsl.governance.model_copy(update={"control_id": "TEST-002"})}
+    )
+
+    assert b'"TEST-002"' in updated.model_json
+    assert updated.model_dict["governance"]["control_id"] == "TEST-002"
+    # The original's caches stay intact
+    assert b'"TEST-001"' in dsl.model_json
+
+
 def test_extra_fields_forbidden():
     """Test that extra fields are rejected (strict validation)"""
     with pytest.raises(ValidationError):
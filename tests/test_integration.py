@@ -143,6 +143,16 @@ def test_end_to_end_control_execution(sample_excel_file, sample_dsl):
         assert len(history) == 1
         assert history[0]["verdict"] == report["verdict"]
 
+        # The ledger record must be self-contained: placeholder SQL plus
+        # the bound values, not placeholders alone
+        row = audit.conn.execute(
+            "SELECT compiled_sql, execution_params FROM executions"
+        ).fetchone()
+        assert row["compiled_sql"] == report["execution_query"]
+        import json
+
+        assert json.loads(row["execution_params"]) == report["execution_params"]
+
         # Cleanup
         engine.close()
         audit.close()
@@ -210,5 +220,36 @@ def test_schema_validation():
     engine.close()
 
 
+def test_ingestion_casts_currency_and_dates():
+    """
+    Currency strings and ISO date strings must come out of ingestion typed,
+    not as strings. Regression: on pandas 3 text columns carry the str dtype
+    rather than object, so an object-only dtype gate skipped the sniffing
+    entirely and Parquet ended up all-string.
+    """
+    with tempfile.TemporaryDirectory() as tmpdir:
+        excel_path = Path(tmpdir) / "test_invoices.xlsx"
+
+        df = pd.DataFrame(
+            {
+                "invoice_id": ["INV-1", "INV-2", "INV-3"],
+                "amount": ["$1,250.00", "$980.50", "$12,345.67"],
+                "invoice_date": ["2025-07-01", "2025-07-15", "2025-08-01"],
+            }
+        )
+        df.to_excel(excel_path, index=False, sheet_name="invoices")
+
+        ingestion = EvidenceIngestion(storage_dir=tmpdir)
+        manifests = ingestion.ingest_excel_to_parquet(
+            str(excel_path), "invoices", "TEST_SYSTEM"
+        )
+
+        result = pd.read_parquet(manifests[0]["parquet_path"])
+
+        assert pd.api.types.is_numeric_dtype(result["amount"])
+        assert result["amount"].tolist() == [1250.00, 980.50, 12345.67]
+        assert pd.api.types.is_datetime64_any_dtype(result["invoice_date"])
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -4,6 +4,7 @@ Validates end-to-end workflow without requiring API keys
 """
 
 import sys
+import tempfile
 from pathlib import Path
 
 # Add project root to path
@@ -17,58 +18,61 @@ def test_orchestrator_with_mock():
     """
     Tests orchestrator with mock AI translator.
     This validates the full workflow without API calls.
+    All run artifacts (audit DB, parquet, sidecars) go to a temp dir so
+    test runs never dirty the tracked data/ tree.
     """
     print("=" * 70)
     print("TEST: Orchestrator with Mock AI (No API Key Required)")
     print("=" * 70)
 
-    # Initialize with mock AI
-    orchestrator = BatchOrchestrator(
-        use_mock_ai=True,  # Skip real LLM calls
-        db_path="data/test_audit.db",  # Separate test database
-        parquet_dir="data/test_parquet",
-    )
+    with tempfile.TemporaryDirectory() as tmpdir:
+        # Initialize with mock AI
+        orchestrator = BatchOrchestrator(
+            use_mock_ai=True,  # Skip real LLM calls
+            db_path=f"{tmpdir}/test_audit.db",  # Separate test database
+            parquet_dir=f"{tmpdir}/test_parquet",
+        )
 
-    try:
-        # Process all projects
-        summary = orchestrator.process_all_projects("data/input")
+        try:
+            # Process all projects
+            summary = orchestrator.process_all_projects("data/input")
 
-        # Validate results
-        assert summary["total_projects"] > 0, "No projects processed"
+            # Validate results
+            assert summary["total_projects"] > 0, "No projects processed"
 
-        print("\n" + "=" * 70)
-        print("✅ TEST PASSED")
-        print("=" * 70)
-        print("\nValidation:")
-        print(f"  - Projects processed: {summary['total_projects']}")
-        print(f"  - Pass: {summary['pass_count']}")
-        print(f"  - Fail: {summary['fail_count']}")
-        print(f"  - Error: {summary['error_count']}")
-        print(f"  - Skipped: {summary['skipped_count']}")
+            print("\n" + "=" * 70)
+            print("✅ TEST PASSED")
+            print("=" * 70)
+            print("\nValidation:")
+            print(f"  - Projects processed: {summary['total_projects']}")
+            print(f"  - Pass: {summary['pass_count']}")
+            print(f"  - Fail: {summary['fail_count']}")
+            print(f"  - Error: {summary['error_count']}")
+            print(f"  - Skipped: {summary['skipped_count']}")
 
-        # Check audit database was populated
-        from src.storage.audit_fabric import AuditFabric
+            # Check audit database was populated
+            from src.storage.audit_fabric import AuditFabric
 
-        audit = AuditFabric(db_path="data/test_audit.db")
-        stats = audit.get_dashboard_stats()
-        print("\nAudit Database Stats:")
-        print(f"  - Total controls in DB: {stats['total_controls']}")
-        audit.close()
+            audit = AuditFabric(db_path=f"{tmpdir}/test_audit.db")
+            stats = audit.get_dashboard_stats()
+            print("\nAudit Database Stats:")
+            print(f"  - Total controls in DB: {stats['total_controls']}")
+            audit.close()
 
-        return True
+            return True
 
-    except Exception as e:
-        print("\n" + "=" * 70)
-        print("❌ TEST FAILED")
-        print("=" * 70)
-        print(f"Error: {type(e).__name__}: {str(e)}")
-        import traceback
+        except Exception as e:
+            print("\n" + "=" * 70)
+            print("❌ TEST FAILED")
+            print("=" * 70)
+            print(f"Error: {type(e).__name__}: {str(e)}")
+            import traceback
 
-        traceback.print_exc()
-        return False
+            traceback.print_exc()
+            return False
 
-    finally:
-        orchestrator.close()
+        finally:
+            orchestrator.close()
 
 
 def test_orchestrator_with_missing_project():
@@ -77,17 +81,22 @@ def test_orchestrator_with_missing_project():
     print("TEST: Error Handling - Missing Input Directory")
     print("=" * 70)
 
-    orchestrator = BatchOrchestrator(use_mock_ai=True)
-
-    try:
-        orchestrator.process_all_projects("data/nonexistent")
-        print("❌ Should have raised FileNotFoundError")
-        return False
-    except FileNotFoundError as e:
-        print(f"✅ Correctly caught error: {e}")
-        return True
-    finally:
-        orchestrator.close()
+    with tempfile.TemporaryDirectory() as tmpdir:
+        orchestrator = BatchOrchestrator(
+            use_mock_ai=True,
+            db_path=f"{tmpdir}/test_audit.db",
+            parquet_dir=f"{tmpdir}/test_parquet",
+        )
+
+        try:
+            orchestrator.process_all_projects("data/nonexistent")
+            print("❌ Should have raised FileNotFoundError")
+            return False
+        except FileNotFoundError as e:
+            print(f"✅ Correctly caught error: {e}")
+            return True
+        finally:
+            orchestrator.close()
 
 
 if __name__ == "__main__":
@@ -8,6 +8,7 @@ This test demonstrates the self-healing loop:
 4. Verify the validation catches the error deterministically
 """
 
+import tempfile
 from pathlib import Path
 
 from src.compiler.sql_compiler import ControlCompiler
@@ -74,11 +75,11 @@ def test_validate_sql_dry_run_catches_invalid_column():
         ),
     )
 
-    # Create a test Parquet file with known columns
+    # Create a test Parquet file with known columns, in a temp dir so the
+    # tracked data/ tree stays clean
     import pandas as pd
 
-    test_dir = Path("data/test_parquet")
-    test_dir.mkdir(parents=True, exist_ok=True)
+    test_dir = Path(tempfile.mkdtemp())
 
     # Create test data with only 'status' column (no 'non_existent_column')
     test_df = pd.DataFrame({"status": ["APPROVED", "APPROVED", "REJECTED"]})
@@ -172,8 +173,7 @@ def test_validate_sql_dry_run_accepts_valid_sql():
 
     import pandas as pd
 
-    test_dir = Path("data/test_parquet")
-    test_dir.mkdir(parents=True, exist_ok=True)
+    test_dir = Path(tempfile.mkdtemp())
 
     test_df = pd.DataFrame({"status": ["APPROVED", "APPROVED", "REJECTED"]})
     test_parquet = test_dir / "test_correct_validation.parquet"